@@ -26,12 +26,15 @@ class Settings(BaseSettings):
     
     # File Storage
     upload_dir: str = "/app/uploads"
+    max_upload_mb: int = 100
     
     # App Info
     app_name: str = "Valence Backend"
     app_version: str = "3.0.0"
     debug: bool = False
     debug_endpoints_enabled: bool = False
+    # Warm TypeDB-backed caches in the background at startup (off for tests)
+    prewarm_caches: bool = True
     
     @property
     def cors_origins_list(self) -> List[str]:
@@ -67,6 +67,10 @@ async def lifespan(app: FastAPI):
                 validate_annotations()
             except Exception as e:
                 logger.warning(f"Annotation validation skipped: {e}")
+
+            if settings.prewarm_caches:
+                from app.services.segment_introspector import prewarm_segment_types
+                prewarm_segment_types()
             # Schema caches (entity fields, relation map, provenance) warm lazily on first extraction
         logger.info(f"Driver after startup: {typedb_client.driver}, "
                     f"is_connected: {typedb_client.is_connected}")
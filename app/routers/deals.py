@@ -4,14 +4,17 @@ Deal endpoints - Simplified for V3 launch (TypeDB 3.x API)
 import hashlib
 import json
 import os
+import time
 import asyncio
 import uuid
 import logging
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
-from fastapi import APIRouter, HTTPException, UploadFile, File, Form, BackgroundTasks
+from fastapi import APIRouter, HTTPException, UploadFile, File, Form, BackgroundTasks, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
+import aiofiles
 import anthropic
 import re
 
@@ -20,8 +23,9 @@ from app.services.typedb_client import typedb_client
 from app.services.extraction import get_extraction_service
 from app.services.topic_router import get_topic_router
 from app.services.graph_traversal import get_rp_entities, get_provision_entities, get_cross_covenant_entities
-from app.services.graph_reader import _get_annotation_map, _get_question_texts, safe_val, run_query
-from app.services.graph_storage import GraphStorage
+from app.services.graph_reader import _get_annotation_map, _get_question_texts, safe_val
+from app.services.graph_storage import GraphStorage, escape_typeql
+from app.services.status_store import extraction_status_store
 from app.schemas.models import UploadResponse, ExtractionStatus
 from typedb.driver import TransactionType
 
@@ -86,23 +90,42 @@ def _safe_get_entity(row, key: str):
         return None
 
 
+# Per-attribute query skeletons for _query_relation_attr: only provision_id
+# varies between calls, so each attribute's query text is built once.
+_RELATION_ATTR_QUERY_CACHE: Dict[str, str] = {}
+
+
+def _relation_attr_query_template(attr_name: str) -> str:
+    template = _RELATION_ATTR_QUERY_CACHE.get(attr_name)
+    if template is None:
+        template = (
+            'match $p isa provision, has provision_id "{provision_id}"; '
+            '$q has question_id $qid; '
+            f'(provision: $p, question: $q) isa provision_has_answer, has {attr_name} $val; '
+            'select $qid, $val;'
+        )
+        _RELATION_ATTR_QUERY_CACHE[attr_name] = template
+    return template
+
+
 def _query_relation_attr(tx, provision_id: str, attr_name: str) -> Dict[str, Any]:
     """Query a single attribute from provision_has_answer using anonymous relation pattern.
 
     TypeDB 3.x can't mix relation variable + attribute access (Object vs ThingType conflict).
     Anonymous relation with inline `has` avoids the conflict.
     """
-    query = f"""
-        match
-            $p isa provision, has provision_id "{provision_id}";
-            $q has question_id $qid;
-            (provision: $p, question: $q) isa provision_has_answer,
-                has {attr_name} $val;
-        select $qid, $val;
-    """
-    result = tx.query(query).resolve()
+    return _relation_attr_rows(_submit_relation_attr(tx, provision_id, attr_name))
+
+
+def _submit_relation_attr(tx, provision_id: str, attr_name: str):
+    """Submit the _query_relation_attr query without resolving it (for pipelining)."""
+    return tx.query(_relation_attr_query_template(attr_name).format(provision_id=provision_id))
+
+
+def _relation_attr_rows(promise) -> Dict[str, Any]:
+    """Resolve a submitted _query_relation_attr query into {qid: value}."""
     answers = {}
-    for row in result.as_concept_rows():
+    for row in promise.resolve().as_concept_rows():
         qid = _safe_get_value(row, "qid")
         val = _safe_get_value(row, "val")
         if qid is not None and val is not None:
@@ -110,24 +133,162 @@ def _query_relation_attr(tx, provision_id: str, attr_name: str) -> Dict[str, Any
     return answers
 
 
+# provision_has_answer value slots (each answer has exactly one) and provenance attrs
+_ANSWER_VALUE_ATTRS = ("answer_boolean", "answer_string", "answer_integer", "answer_double", "answer_date")
+_ANSWER_PROVENANCE_ATTRS = ("source_text", "source_page", "source_section", "confidence")
+
+
 def _load_provision_answers(tx, provision_id: str) -> Dict[str, Dict]:
     """Load all scalar answers for a provision, returning {qid: {value, source_text, source_page, confidence}}."""
     stored = {}
 
+    # Submit all value + provenance queries before resolving any: one
+    # round-trip for the provision instead of one per attribute
+    value_promises = [_submit_relation_attr(tx, provision_id, attr) for attr in _ANSWER_VALUE_ATTRS]
+    provenance_promises = [
+        (attr, _submit_relation_attr(tx, provision_id, attr)) for attr in _ANSWER_PROVENANCE_ATTRS
+    ]
+
     # Get values — each answer has exactly one type
-    for attr in ("answer_boolean", "answer_string", "answer_integer", "answer_double", "answer_date"):
-        for qid, val in _query_relation_attr(tx, provision_id, attr).items():
+    for promise in value_promises:
+        for qid, val in _relation_attr_rows(promise).items():
             stored.setdefault(qid, {})["value"] = val
 
-    # Get provenance fields
-    for attr, key in [("source_text", "source_text"), ("source_page", "source_page"), ("source_section", "source_section"), ("confidence", "confidence")]:
-        for qid, val in _query_relation_attr(tx, provision_id, attr).items():
-            if qid in stored:
-                stored[qid][key] = val
+    # Get provenance fields (only for answers that have a value: key-view
+    # intersection instead of a membership test per provenance row)
+    for attr, promise in provenance_promises:
+        vals = _relation_attr_rows(promise)
+        for qid in vals.keys() & stored.keys():
+            stored[qid][attr] = vals[qid]
 
     return stored
 
 
+# Question metadata used to label Q&A context is ontology data, not deal data:
+# cache it per covenant type instead of re-querying TypeDB on every question.
+_QUESTION_META_TTL = 300  # seconds
+_question_meta_cache: Dict[str, tuple] = {}  # {covenant_type: (loaded_at, {qid: meta})}
+_concept_type_labels_cache: Optional[tuple] = None  # (loaded_at, {concept_type: question_text})
+
+
+def invalidate_question_meta_cache() -> None:
+    """Drop cached question metadata / concept labels (e.g. after an ontology reload)."""
+    global _concept_type_labels_cache
+    _question_meta_cache.clear()
+    _concept_type_labels_cache = None
+
+
+def _question_meta_query(covenant_types: List[str]) -> str:
+    """Build the question-metadata match for one or more covenant types.
+
+    One type is matched directly by attribute value; several are pushed into
+    the match as a disjunction, so they cost one query and only their rows
+    come back.
+    """
+    if len(covenant_types) == 1:
+        ct_match = f'has covenant_type "{escape_typeql(covenant_types[0])}",'
+        ct_filter = ""
+        ct_select = ""
+    else:
+        ct_match = "has covenant_type $ct,"
+        ct_filter = " or ".join(
+            f'{{ $ct == "{escape_typeql(ct)}"; }}' for ct in covenant_types
+        ) + ";"
+        ct_select = "$ct, "
+    return f"""
+            match
+                $q isa ontology_question,
+                    {ct_match}
+                    has question_id $qid,
+                    has question_text $qtext;
+                {ct_filter}
+                (category: $cat, question: $q) isa category_has_question;
+                $cat has category_id $cid, has name $cname;
+            select {ct_select}$qid, $qtext, $cid, $cname;
+        """
+
+
+def _query_question_meta(covenant_types: List[str]) -> Dict[str, Dict[str, Dict]]:
+    """Query {covenant_type: {qid: {question_text, category_id, category_name}}}."""
+    by_type: Dict[str, Dict[str, Dict]] = {ct: {} for ct in covenant_types}
+    # Single type: $ct isn't bound by the query, every row belongs to it
+    only_ct = covenant_types[0] if len(covenant_types) == 1 else None
+    tx = typedb_client.driver.transaction(settings.typedb_database, TransactionType.READ)
+    try:
+        meta_result = tx.query(_question_meta_query(covenant_types)).resolve()
+        for row in meta_result.as_concept_rows():
+            ct = only_ct or _safe_get_value(row, "ct")
+            qid = _safe_get_value(row, "qid")
+            qtext = _safe_get_value(row, "qtext")
+            if ct in by_type and qid and qtext:
+                by_type[ct][qid] = {
+                    "question_text": qtext,
+                    "category_id": _safe_get_value(row, "cid") or "ZZ",
+                    "category_name": _safe_get_value(row, "cname") or "Other",
+                }
+    finally:
+        tx.close()
+    return by_type
+
+
+def _load_question_meta(covenant_types: List[str]) -> Dict[str, Dict]:
+    """Question metadata for the given covenant types, cached for _QUESTION_META_TTL."""
+    now = time.time()
+    stale = [
+        ct for ct in covenant_types
+        if ct not in _question_meta_cache
+        or (now - _question_meta_cache[ct][0]) > _QUESTION_META_TTL
+    ]
+    if stale:
+        for ct, meta in _query_question_meta(stale).items():
+            _question_meta_cache[ct] = (now, meta)
+
+    question_meta = {}
+    for ct in covenant_types:
+        question_meta.update(_question_meta_cache[ct][1])
+    return question_meta
+
+
+def _load_concept_type_labels() -> Dict[str, str]:
+    """Multiselect concept type → question_text labels, cached for _QUESTION_META_TTL."""
+    global _concept_type_labels_cache
+    now = time.time()
+    if (_concept_type_labels_cache is not None
+            and (now - _concept_type_labels_cache[0]) <= _QUESTION_META_TTL):
+        return _concept_type_labels_cache[1]
+
+    concept_type_labels = {}
+    tx = typedb_client.driver.transaction(settings.typedb_database, TransactionType.READ)
+    try:
+        label_query = """
+            match
+                $q isa ontology_question,
+                    has question_text $qt,
+                    has answer_type "multiselect";
+                (question: $q) isa question_targets_concept,
+                    has target_concept_type $tct;
+            select $qt, $tct;
+        """
+        label_result = tx.query(label_query).resolve()
+        for row in label_result.as_concept_rows():
+            qt = _safe_get_value(row, "qt")
+            tct = _safe_get_value(row, "tct")
+            if qt and tct:
+                concept_type_labels[tct] = qt
+    finally:
+        tx.close()
+    _concept_type_labels_cache = (now, concept_type_labels)
+    return concept_type_labels
+
+
+# Patterns for parsing Claude's Q&A output, compiled once at import
+_CODE_FENCE_OPEN_RE = re.compile(r'^```(?:json)?\s*\n?')
+_CODE_FENCE_CLOSE_RE = re.compile(r'\n?```\s*$')
+_EVIDENCE_BLOCK_RE = re.compile(r'<!--\s*EVIDENCE:\s*\[([^\]]*)\]\s*-->')
+_SECTION_PAGE_CITE_RE = re.compile(r'\[([^,\]]+),\s*p\.(\d+)\]')
+_PAGE_CITE_RE = re.compile(r'\[p\.(\d+)\]')
+
+
 # Request/Response models for Q&A
 class AskRequest(BaseModel):
     question: str
@@ -139,8 +300,8 @@ class AskResponse(BaseModel):
     answer: str
     citations: List[Dict[str, Any]]
 
-# In-memory extraction status tracking (for MVP; use Redis in production)
-extraction_status: Dict[str, ExtractionStatus] = {}
+# Extraction status tracking (process-local, bounded retention)
+extraction_status = extraction_status_store
 
 
 def _detect_covenant_type(question: str) -> str:
@@ -163,6 +324,31 @@ def _detect_covenant_type(question: str) -> str:
 UPLOADS_DIR = "/app/uploads"
 os.makedirs(UPLOADS_DIR, exist_ok=True)
 
+# Uploads are streamed to disk in chunks of this size
+_UPLOAD_CHUNK_BYTES = 1 << 20
+
+
+async def _stream_upload(file: UploadFile, dest_path: str) -> tuple:
+    """Stream an upload to dest_path in chunks; return (size, sha256 hex).
+
+    Raises 413 once the upload passes settings.max_upload_mb. The caller
+    owns dest_path, including removing it on failure.
+    """
+    max_bytes = settings.max_upload_mb * 1024 * 1024
+    hasher = hashlib.sha256()
+    size = 0
+    async with aiofiles.open(dest_path, "wb") as f:
+        while chunk := await file.read(_UPLOAD_CHUNK_BYTES):
+            size += len(chunk)
+            if size > max_bytes:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"PDF exceeds {settings.max_upload_mb} MB upload limit",
+                )
+            hasher.update(chunk)
+            await f.write(chunk)
+    return size, hasher.hexdigest()
+
 
 @router.get("")
 async def list_deals() -> List[Dict[str, Any]]:
@@ -224,10 +410,13 @@ async def upload_deal(
     if not file.filename or not file.filename.lower().endswith('.pdf'):
         raise HTTPException(status_code=400, detail="Only PDF files are accepted")
 
+    # Stream to a temp file (renamed once the deal_id exists), hashing
+    # as we go, so the PDF is never held in memory as a whole
+    tmp_path = os.path.join(UPLOADS_DIR, f"upload-{uuid.uuid4().hex}.part")
+    pdf_path = None
     try:
-        # Read file and compute SHA-256 hash for deduplication
-        contents = await file.read()
-        pdf_hash = hashlib.sha256(contents).hexdigest()
+        # Compute SHA-256 hash for deduplication while saving
+        size, pdf_hash = await _stream_upload(file, tmp_path)
 
         # Check for duplicate: query TypeDB for existing document with same hash
         existing_deal_id = None
@@ -268,17 +457,16 @@ async def upload_deal(
         pdf_path = os.path.join(UPLOADS_DIR, pdf_filename)
 
         # Save PDF to disk
-        with open(pdf_path, "wb") as f:
-            f.write(contents)
+        os.replace(tmp_path, pdf_path)
 
-        logger.info(f"Saved PDF: {pdf_path} ({len(contents)} bytes, hash={pdf_hash[:12]}...)")
+        logger.info(f"Saved PDF: {pdf_path} ({size} bytes, hash={pdf_hash[:12]}...)")
 
         # Create deal + document in TypeDB, link via deal_has_document
         tx = typedb_client.driver.transaction(settings.typedb_database, TransactionType.WRITE)
         try:
-            # Escape quotes in strings
-            safe_name = deal_name.replace('"', '\\"')
-            safe_borrower = borrower.replace('"', '\\"')
+            # Escape user-supplied strings for TypeQL
+            safe_name = escape_typeql(deal_name)
+            safe_borrower = escape_typeql(borrower)
 
             from datetime import datetime, timezone
             now_iso = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
@@ -329,9 +517,13 @@ async def upload_deal(
     except Exception as e:
         logger.error(f"Upload failed: {e}")
         # Clean up on failure
-        if os.path.exists(pdf_path):
+        if pdf_path and os.path.exists(pdf_path):
             os.remove(pdf_path)
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        # Left behind only by duplicates, rejected uploads and failures
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
 
 @router.get("/{deal_id}")
 async def get_deal(deal_id: str) -> Dict[str, Any]:
@@ -576,8 +768,7 @@ async def delete_deal(deal_id: str) -> Dict[str, Any]:
             di_path.unlink()
 
         # 12. Clear extraction status
-        if deal_id in extraction_status:
-            del extraction_status[deal_id]
+        extraction_status.pop(deal_id, None)
 
         return {"status": "deleted", "deal_id": deal_id}
 
@@ -609,21 +800,25 @@ async def run_extraction(deal_id: str, pdf_path: str):
             deal_id=deal_id, status="extracting", progress=10,
             current_step="Parsing PDF..."
         )
-        document_text = extraction_svc.parse_document(pdf_path)
+        # Parsing, segmentation and universe builds are blocking (PyMuPDF,
+        # synchronous Claude calls); run them in worker threads so the
+        # event loop keeps serving requests during extraction
+        document_text = await asyncio.to_thread(extraction_svc.parse_document, pdf_path)
 
         # Step 2: Segment document
         extraction_status[deal_id] = ExtractionStatus(
             deal_id=deal_id, status="extracting", progress=20,
             current_step="Segmenting document..."
         )
-        segment_map = extraction_svc.segment_document(document_text)
+        segment_map = await asyncio.to_thread(extraction_svc.segment_document, document_text)
 
         # Step 3: RP extraction
         extraction_status[deal_id] = ExtractionStatus(
             deal_id=deal_id, status="extracting", progress=30,
             current_step="Building RP universe..."
         )
-        rp_universe = extraction_svc.get_or_build_universe(
+        rp_universe = await asyncio.to_thread(
+            extraction_svc.get_or_build_universe,
             deal_id=deal_id, covenant_type="RP",
             document_text=document_text, segment_map=segment_map,
 
@@ -648,7 +843,8 @@ async def run_extraction(deal_id: str, pdf_path: str):
                 deal_id=deal_id, status="extracting", progress=55,
                 current_step="Building DI universe..."
             )
-            di_universe = extraction_svc.get_or_build_universe(
+            di_universe = await asyncio.to_thread(
+                extraction_svc.get_or_build_universe,
                 deal_id=deal_id, covenant_type="DI",
                 document_text=document_text, segment_map=segment_map,
             )
@@ -673,7 +869,8 @@ async def run_extraction(deal_id: str, pdf_path: str):
                 deal_id=deal_id, status="extracting", progress=80,
                 current_step="Building MFN universe..."
             )
-            mfn_universe = extraction_svc.get_or_build_universe(
+            mfn_universe = await asyncio.to_thread(
+                extraction_svc.get_or_build_universe,
                 deal_id=deal_id, covenant_type="MFN",
                 document_text=document_text, segment_map=segment_map,
             )
@@ -760,24 +957,30 @@ async def upload_pdf_for_deal(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-    # Save PDF
+    # Save PDF (streamed to a temp file, then swapped in, so a failed
+    # upload never leaves a truncated PDF in place of the old one)
     pdf_path = os.path.join(UPLOADS_DIR, f"{deal_id}.pdf")
+    tmp_path = os.path.join(UPLOADS_DIR, f"upload-{uuid.uuid4().hex}.part")
     try:
-        contents = await file.read()
-        with open(pdf_path, "wb") as f:
-            f.write(contents)
+        size, _ = await _stream_upload(file, tmp_path)
+        os.replace(tmp_path, pdf_path)
 
-        logger.info(f"Saved PDF for deal {deal_id}: {pdf_path} ({len(contents)} bytes)")
+        logger.info(f"Saved PDF for deal {deal_id}: {pdf_path} ({size} bytes)")
 
         return {
             "status": "success",
             "deal_id": deal_id,
-            "pdf_size": len(contents),
+            "pdf_size": size,
             "message": "PDF uploaded successfully."
         }
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to save PDF: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
 
 
 @router.post("/{deal_id}/extract/{covenant_type}")
@@ -883,8 +1086,9 @@ def _ensure_deal_exists(deal_id: str):
 @router.get("/{deal_id}/status", response_model=ExtractionStatus)
 async def get_extraction_status(deal_id: str) -> ExtractionStatus:
     """Get the extraction status for a deal."""
-    if deal_id in extraction_status:
-        return extraction_status[deal_id]
+    status = extraction_status.get(deal_id)
+    if status is not None:
+        return status
 
     # Check if deal exists but extraction never started
     try:
@@ -912,6 +1116,50 @@ async def get_extraction_status(deal_id: str) -> ExtractionStatus:
     raise HTTPException(status_code=404, detail="Deal not found")
 
 
+# SSE status stream: how often the in-process store is checked for a new
+# status, and how often an idle stream sends a keep-alive comment
+_STATUS_STREAM_CHECK_SECONDS = 0.5
+_STATUS_STREAM_KEEPALIVE_SECONDS = 15
+
+
+@router.get("/{deal_id}/status/stream")
+async def stream_extraction_status(deal_id: str, request: Request) -> StreamingResponse:
+    """Stream extraction status as Server-Sent Events until it finishes.
+
+    Emits one `data:` event (ExtractionStatus JSON) per status change,
+    ending after "complete" or "error". Replaces polling /status.
+    """
+    # Resolves untracked deals and raises 404 before the stream opens
+    first = await get_extraction_status(deal_id)
+
+    async def events():
+        status = first
+        yield f"data: {status.model_dump_json()}\n\n"
+        idle = 0.0
+        while status.status not in ("complete", "error"):
+            await asyncio.sleep(_STATUS_STREAM_CHECK_SECONDS)
+            if await request.is_disconnected():
+                return
+            current = extraction_status.get(deal_id)
+            if current is None:
+                return
+            if current is not status:
+                status = current
+                idle = 0.0
+                yield f"data: {status.model_dump_json()}\n\n"
+            else:
+                idle += _STATUS_STREAM_CHECK_SECONDS
+                if idle >= _STATUS_STREAM_KEEPALIVE_SECONDS:
+                    idle = 0.0
+                    yield ": keep-alive\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/{deal_id}/answers")
 async def get_deal_answers(deal_id: str, covenant_type: str = "RP") -> Dict[str, Any]:
     """
@@ -1096,17 +1344,27 @@ async def get_deal_answers(deal_id: str, covenant_type: str = "RP") -> Dict[str,
         raise HTTPException(status_code=500, detail=str(e))
 
 
-def _load_entity_booleans(provision_id: str) -> dict:
+def _load_entity_booleans(provision_id: str, tx=None) -> dict:
     """Load all annotated entity attributes for a provision.
 
     Returns dict[entity_type] → dict[attr_name] → {value, question_id, question_text}
     For multi-instance entities, returns a list of dicts instead.
 
+    All per-entity-type queries run in one read transaction: the caller's tx
+    if given (e.g. _get_provision's), else one opened here.
+
     Both data sources are TypeDB SSoT:
     - Annotation map: question_annotates_attribute relations
     - Entity relation map: schema introspection of plays declarations
     No hardcoded attribute lists or relation mappings.
     """
+    if tx is None:
+        tx = typedb_client.driver.transaction(settings.typedb_database, TransactionType.READ)
+        try:
+            return _load_entity_booleans(provision_id, tx)
+        finally:
+            tx.close()
+
     annotation_map = _get_annotation_map()
     question_texts = _get_question_texts()
     entity_relation_map = GraphStorage._load_entity_relation_map()
@@ -1147,7 +1405,12 @@ def _load_entity_booleans(provision_id: str) -> dict:
         '''
 
         try:
-            rows = run_query(query)
+            rows = tx.query(query).resolve().as_concept_rows()
+        except Exception as e:
+            logger.debug(f"Entity boolean query failed for {entity_type}: {e}")
+            continue
+
+        try:
             instances = []
             for row in rows:
                 entity_data = {}
@@ -1175,8 +1438,17 @@ def _load_entity_booleans(provision_id: str) -> dict:
 
 
 async def _get_provision(deal_id: str, covenant_type: str) -> Dict[str, Any]:
+    """Unified provision getter for any covenant type (RP, MFN, DI).
+
+    The TypeDB reads are blocking, so they run on a worker thread
+    (asyncio.to_thread) instead of stalling the event loop; see _read_provision.
+    """
+    return await asyncio.to_thread(_read_provision, deal_id, covenant_type)
+
+
+def _read_provision(deal_id: str, covenant_type: str) -> Dict[str, Any]:
     """
-    Unified provision getter for any covenant type (RP, MFN, DI).
+    Unified provision reader for any covenant type (RP, MFN, DI).
 
     Returns:
         - provision_id, provision_type
@@ -1214,8 +1486,9 @@ async def _get_provision(deal_id: str, covenant_type: str) -> Dict[str, Any]:
             # Get scalar answers via provision_has_answer (SSoT)
             scalar_answers = _load_provision_answers(tx, provision_id)
 
-            # Get pattern flags (flat boolean attributes on the provision entity)
-            pattern_flags = {}
+            # Pattern flags + concept applicabilities: submit every query before
+            # resolving any, so they share one round-trip instead of one each
+            flag_promises = []
             for flag_name in flag_names:
                 try:
                     flag_query = f"""
@@ -1224,16 +1497,10 @@ async def _get_provision(deal_id: str, covenant_type: str) -> Dict[str, Any]:
                                 has {flag_name} $val;
                         select $val;
                     """
-                    flag_result = tx.query(flag_query).resolve()
-                    for row in flag_result.as_concept_rows():
-                        val = _safe_get_value(row, "val")
-                        if val is not None:
-                            pattern_flags[flag_name] = val
+                    flag_promises.append((flag_name, tx.query(flag_query)))
                 except Exception:
-                    pass  # Flag not set on this provision
+                    pass  # Flag not in schema
 
-            # Get all concept applicabilities (multiselect answers)
-            multiselect_answers = {}
             applicability_query = f"""
                 match
                     $p isa {provision_type}, has provision_id "{provision_id}";
@@ -1241,7 +1508,22 @@ async def _get_provision(deal_id: str, covenant_type: str) -> Dict[str, Any]:
                     $c has concept_id $cid, has name $cname;
                 select $c, $cid, $cname;
             """
-            applicability_result = tx.query(applicability_query).resolve()
+            applicability_promise = tx.query(applicability_query)
+
+            # Get pattern flags (flat boolean attributes on the provision entity)
+            pattern_flags = {}
+            for flag_name, flag_promise in flag_promises:
+                try:
+                    for row in flag_promise.resolve().as_concept_rows():
+                        val = _safe_get_value(row, "val")
+                        if val is not None:
+                            pattern_flags[flag_name] = val
+                except Exception:
+                    pass  # Flag not set on this provision
+
+            # Get all concept applicabilities (multiselect answers)
+            multiselect_answers = {}
+            applicability_result = applicability_promise.resolve()
             for row in applicability_result.as_concept_rows():
                 concept_entity = _safe_get_entity(row, "c")
                 concept_id = _safe_get_value(row, "cid")
@@ -1256,12 +1538,13 @@ async def _get_provision(deal_id: str, covenant_type: str) -> Dict[str, Any]:
                         "name": concept_name or "Unknown"
                     })
 
+            # Entity booleans: all annotated attributes from typed entities (SSoT),
+            # read in this same transaction
+            entity_booleans = _load_entity_booleans(provision_id, tx)
+
         finally:
             tx.close()
 
-        # Entity booleans: all annotated attributes from typed entities (SSoT)
-        entity_booleans = _load_entity_booleans(provision_id)
-
         return {
             "deal_id": deal_id,
             "provision_id": provision_id,
@@ -1283,6 +1566,41 @@ async def _get_provision(deal_id: str, covenant_type: str) -> Dict[str, Any]:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _load_qa_provisions(deal_id: str, covenant_type: str) -> tuple:
+    """Load the RP/MFN provisions a routed question needs.
+
+    Returns (rp_response, mfn_response, covenant_type). When both covenants
+    are wanted the two loads run concurrently on worker threads. A missing
+    provision (404) yields None; an MFN-only question with no MFN data falls
+    back to RP.
+    """
+    async def _load_optional(ct: str) -> Optional[Dict[str, Any]]:
+        try:
+            return await _get_provision(deal_id, ct)
+        except HTTPException as e:
+            if e.status_code != 404:
+                raise
+            return None
+
+    async def _skip() -> None:
+        return None
+
+    rp_response, mfn_response = await asyncio.gather(
+        _load_optional("RP") if covenant_type in ("rp", "both") else _skip(),
+        _load_optional("MFN") if covenant_type in ("mfn", "both") else _skip(),
+    )
+
+    # If MFN-only question but no MFN data, fall back to RP
+    if covenant_type == "mfn" and not mfn_response:
+        try:
+            rp_response = await get_rp_provision(deal_id)
+            covenant_type = "rp"
+        except HTTPException:
+            pass
+
+    return rp_response, mfn_response, covenant_type
+
+
 @router.get("/{deal_id}/rp-provision")
 async def get_rp_provision(deal_id: str) -> Dict[str, Any]:
     """Get the RP provision for a deal. Alias for get_provision(covenant_type=RP)."""
@@ -1426,30 +1744,9 @@ async def ask_question(deal_id: str, request: AskRequest) -> Dict[str, Any]:
         route_result = None
 
     # Step 2: Load provision data based on detected type
-    rp_response = None
-    mfn_response = None
-
-    if covenant_type in ("rp", "both"):
-        try:
-            rp_response = await get_rp_provision(deal_id)
-        except HTTPException as e:
-            if e.status_code != 404:
-                raise
-
-    if covenant_type in ("mfn", "both"):
-        try:
-            mfn_response = await get_mfn_provision(deal_id)
-        except HTTPException as e:
-            if e.status_code != 404:
-                raise
-
-    # If MFN-only question but no MFN data, fall back to RP
-    if covenant_type == "mfn" and not mfn_response:
-        try:
-            rp_response = await get_rp_provision(deal_id)
-            covenant_type = "rp"
-        except HTTPException:
-            pass
+    rp_response, mfn_response, covenant_type = await _load_qa_provisions(
+        deal_id, covenant_type
+    )
 
     # Check we have some data
     total_scalar = 0
@@ -1478,50 +1775,9 @@ async def ask_question(deal_id: str, request: AskRequest) -> Dict[str, Any]:
         covenant_types_to_load.append("MFN")
 
     try:
-        tx = typedb_client.driver.transaction(settings.typedb_database, TransactionType.READ)
-        try:
-            for ct in covenant_types_to_load:
-                meta_query = f"""
-                    match
-                        $q isa ontology_question,
-                            has covenant_type "{ct}",
-                            has question_id $qid,
-                            has question_text $qtext;
-                        (category: $cat, question: $q) isa category_has_question;
-                        $cat has category_id $cid, has name $cname;
-                    select $qid, $qtext, $cid, $cname;
-                """
-                meta_result = tx.query(meta_query).resolve()
-                for row in meta_result.as_concept_rows():
-                    qid = _safe_get_value(row, "qid")
-                    qtext = _safe_get_value(row, "qtext")
-                    cid = _safe_get_value(row, "cid")
-                    cname = _safe_get_value(row, "cname")
-                    if qid and qtext:
-                        question_meta[qid] = {
-                            "question_text": qtext,
-                            "category_id": cid or "ZZ",
-                            "category_name": cname or "Other",
-                        }
-
-            # Load multiselect concept type → question_text labels from TypeDB
-            label_query = """
-                match
-                    $q isa ontology_question,
-                        has question_text $qt,
-                        has answer_type "multiselect";
-                    (question: $q) isa question_targets_concept,
-                        has target_concept_type $tct;
-                select $qt, $tct;
-            """
-            label_result = tx.query(label_query).resolve()
-            for row in label_result.as_concept_rows():
-                qt = _safe_get_value(row, "qt")
-                tct = _safe_get_value(row, "tct")
-                if qt and tct:
-                    concept_type_labels[tct] = qt
-        finally:
-            tx.close()
+        question_meta = _load_question_meta(covenant_types_to_load)
+        # Multiselect concept type → question_text labels from TypeDB
+        concept_type_labels = _load_concept_type_labels()
     except Exception:
         pass  # Proceed with empty metadata — context will still work
 
@@ -1554,10 +1810,13 @@ async def ask_question(deal_id: str, request: AskRequest) -> Dict[str, Any]:
         category_guidance = topic_router.get_synthesis_guidance(route_result.matched_categories)
         if not category_guidance:
             # Broad question — load ALL categories for this covenant type
+            # (CategoryMetadata.covenant_type is already upper-case; "both" keeps all)
             all_cats = topic_router.get_all_categories()
-            relevant = [c for c in all_cats.values()
-                        if c.covenant_type.upper() == covenant_type.upper()
-                        or covenant_type == "both"]
+            if covenant_type == "both":
+                relevant = list(all_cats.values())
+            else:
+                wanted = covenant_type.upper()
+                relevant = [c for c in all_cats.values() if c.covenant_type == wanted]
             category_guidance = topic_router.get_synthesis_guidance(relevant)
     else:
         category_guidance = ""
@@ -1662,8 +1921,8 @@ This block MUST appear at the very end of your response."""
                 raw = answer_text.strip()
                 # Strip markdown code fences (```json ... ``` or ``` ... ```)
                 if raw.startswith("```"):
-                    raw = re.sub(r'^```(?:json)?\s*\n?', '', raw)
-                    raw = re.sub(r'\n?```\s*$', '', raw)
+                    raw = _CODE_FENCE_OPEN_RE.sub('', raw)
+                    raw = _CODE_FENCE_CLOSE_RE.sub('', raw)
                 # Find JSON object boundaries
                 start = raw.find('{')
                 end = raw.rfind('}')
@@ -1753,29 +2012,9 @@ async def ask_question_flat(deal_id: str, request: AskRequest) -> Dict[str, Any]
         route_result = None
 
     # Step 2: Load provision data (same as /ask)
-    rp_response = None
-    mfn_response = None
-
-    if covenant_type in ("rp", "both"):
-        try:
-            rp_response = await get_rp_provision(deal_id)
-        except HTTPException as e:
-            if e.status_code != 404:
-                raise
-
-    if covenant_type in ("mfn", "both"):
-        try:
-            mfn_response = await get_mfn_provision(deal_id)
-        except HTTPException as e:
-            if e.status_code != 404:
-                raise
-
-    if covenant_type == "mfn" and not mfn_response:
-        try:
-            rp_response = await get_rp_provision(deal_id)
-            covenant_type = "rp"
-        except HTTPException:
-            pass
+    rp_response, mfn_response, covenant_type = await _load_qa_provisions(
+        deal_id, covenant_type
+    )
 
     total_scalar = 0
     total_multiselect = 0
@@ -1839,8 +2078,8 @@ async def ask_question_flat(deal_id: str, request: AskRequest) -> Dict[str, Any]
 
             raw = answer_text.strip()
             if raw.startswith("```"):
-                raw = re.sub(r'^```(?:json)?\s*\n?', '', raw)
-                raw = re.sub(r'\n?```\s*$', '', raw)
+                raw = _CODE_FENCE_OPEN_RE.sub('', raw)
+                raw = _CODE_FENCE_CLOSE_RE.sub('', raw)
             start = raw.find('{')
             end = raw.rfind('}')
             if start != -1 and end != -1:
@@ -1871,36 +2110,12 @@ async def ask_question_flat(deal_id: str, request: AskRequest) -> Dict[str, Any]
         # Load question metadata for evidence resolution
         question_meta = {}
         try:
-            tx = typedb_client.driver.transaction(settings.typedb_database, TransactionType.READ)
-            try:
-                covenant_types_to_load = []
-                if rp_response:
-                    covenant_types_to_load.append("RP")
-                if mfn_response:
-                    covenant_types_to_load.append("MFN")
-                for ct in covenant_types_to_load:
-                    meta_query = f"""
-                        match
-                            $q isa ontology_question,
-                                has covenant_type "{ct}",
-                                has question_id $qid,
-                                has question_text $qtext;
-                            (category: $cat, question: $q) isa category_has_question;
-                            $cat has category_id $cid, has name $cname;
-                        select $qid, $qtext, $cid, $cname;
-                    """
-                    meta_result = tx.query(meta_query).resolve()
-                    for row in meta_result.as_concept_rows():
-                        qid = _safe_get_value(row, "qid")
-                        qtext = _safe_get_value(row, "qtext")
-                        if qid and qtext:
-                            question_meta[qid] = {
-                                "question_text": qtext,
-                                "category_id": _safe_get_value(row, "cid") or "ZZ",
-                                "category_name": _safe_get_value(row, "cname") or "Other",
-                            }
-            finally:
-                tx.close()
+            covenant_types_to_load = []
+            if rp_response:
+                covenant_types_to_load.append("RP")
+            if mfn_response:
+                covenant_types_to_load.append("MFN")
+            question_meta = _load_question_meta(covenant_types_to_load)
         except Exception:
             pass
 
@@ -2041,10 +2256,13 @@ async def ask_question_graph(deal_id: str, request: AskRequest, trace: bool = Fa
         category_guidance = topic_router.get_synthesis_guidance(route_result.matched_categories)
         if not category_guidance:
             # Broad question — load ALL categories for this covenant type
+            # (CategoryMetadata.covenant_type is already upper-case; "both" keeps all)
             all_cats = topic_router.get_all_categories()
-            relevant = [c for c in all_cats.values()
-                        if c.covenant_type.upper() == covenant_type.upper()
-                        or covenant_type == "both"]
+            if covenant_type == "both":
+                relevant = list(all_cats.values())
+            else:
+                wanted = covenant_type.upper()
+                relevant = [c for c in all_cats.values() if c.covenant_type == wanted]
             category_guidance = topic_router.get_synthesis_guidance(relevant)
     else:
         category_guidance = ""
@@ -2168,8 +2386,8 @@ Return ONLY the JSON object. No explanation."""
         filter_text = filter_response.content[0].text.strip()
         logger.debug(f"Raw filter response: {repr(filter_text[:300])}")
         if filter_text.startswith("```"):
-            filter_text = re.sub(r'^```(?:json)?\s*\n?', '', filter_text)
-            filter_text = re.sub(r'\n?```\s*$', '', filter_text)
+            filter_text = _CODE_FENCE_OPEN_RE.sub('', filter_text)
+            filter_text = _CODE_FENCE_CLOSE_RE.sub('', filter_text)
         start_idx = filter_text.find('{')
         end_idx = filter_text.rfind('}')
         if start_idx != -1 and end_idx != -1:
@@ -2256,20 +2474,13 @@ Return ONLY the JSON object. No explanation."""
         answer_text = response.content[0].text
 
         # Parse evidence block
-        evidence_match = re.search(
-            r'<!--\s*EVIDENCE:\s*\[([^\]]*)\]\s*-->',
-            answer_text,
-        )
+        evidence_match = _EVIDENCE_BLOCK_RE.search(answer_text)
         clean_answer = answer_text
         evidence_entities = []
         if evidence_match:
             clean_answer = answer_text[:evidence_match.start()].rstrip()
             raw_ids = evidence_match.group(1)
-            evidence_entities = [
-                eid.strip().strip('"').strip("'")
-                for eid in raw_ids.split(",")
-                if eid.strip()
-            ]
+            evidence_entities = _parse_evidence_ids(raw_ids)
 
         citations = _extract_citations_from_answer(clean_answer)
 
@@ -2319,6 +2530,38 @@ Return ONLY the JSON object. No explanation."""
 # MFN entities now flow through polymorphic fetch (get_provision_entities).
 
 
+# Display labels for provision pattern flags in Q&A context
+_PATTERN_FLAG_LABELS = {
+    "jcrew_pattern_detected": "J.Crew blocker pattern detected",
+    "serta_pattern_detected": "Serta pattern detected",
+    "collateral_leakage_pattern_detected": "Collateral leakage pattern detected",
+}
+
+
+def _format_fact_line(q_text: str, value: Any, page: Any, section: str) -> str:
+    """One '- question: value [Section, p.N]' line of Q&A context.
+
+    Module-level and pure so the per-answer loop does no attribute lookups.
+    """
+    if isinstance(value, bool):
+        value_str = "Yes" if value else "No"
+    elif isinstance(value, float) and value == int(value):
+        value_str = str(int(value))
+    else:
+        value_str = str(value)
+
+    # Build citation: prefer "Section X [p.Y]" over just "[p.Y]"
+    if section and page:
+        cite = f" [{section}, p.{page}]"
+    elif section:
+        cite = f" [{section}]"
+    elif page:
+        cite = f" [p.{page}]"
+    else:
+        cite = ""
+    return f"- {q_text}: {value_str}{cite}"
+
+
 def _format_rp_provision_as_context(
     rp_response: Dict,
     question_meta: Dict[str, Dict] = None,
@@ -2340,45 +2583,29 @@ def _format_rp_provision_as_context(
     # ── Scalar answers grouped by category ────────────────────────────
     scalar_answers = rp_response.get("scalar_answers", {})
 
-    # Group answers by (category_id, category_name)
+    # Group answers by (category_id, category_name); the question_meta lookup
+    # happens once per answer here, and q_text rides along for formatting
     by_category: Dict[tuple, list] = {}
     for qid, data in scalar_answers.items():
         meta = question_meta.get(qid)
         if meta:
             cat_key = (meta["category_id"], meta["category_name"])
+            q_text = meta["question_text"]
         else:
             cat_key = ("ZZ", "Other")
-        by_category.setdefault(cat_key, []).append((qid, data))
+            q_text = qid
+        by_category.setdefault(cat_key, []).append((qid, q_text, data))
 
     lines.append("## EXTRACTED ANSWERS")
     lines.append("")
 
     for (cat_id, cat_name), answers in sorted(by_category.items()):
         lines.append(f"### {cat_name} ({cat_id})")
-        for qid, data in sorted(answers, key=lambda x: x[0]):
-            meta = question_meta.get(qid)
-            q_text = meta["question_text"] if meta else qid
-
-            value = data.get("value")
-            if isinstance(value, bool):
-                value_str = "Yes" if value else "No"
-            elif isinstance(value, float) and value == int(value):
-                value_str = str(int(value))
-            else:
-                value_str = str(value)
-
-            page = data.get("source_page")
-            section = data.get("source_section", "")
-            # Build citation: prefer "Section X [p.Y]" over just "[p.Y]"
-            if section and page:
-                cite = f" [{section}, p.{page}]"
-            elif section:
-                cite = f" [{section}]"
-            elif page:
-                cite = f" [p.{page}]"
-            else:
-                cite = ""
-            lines.append(f"- {q_text}: {value_str}{cite}")
+        for qid, q_text, data in sorted(answers, key=lambda x: x[0]):
+            lines.append(_format_fact_line(
+                q_text, data.get("value"),
+                data.get("source_page"), data.get("source_section", ""),
+            ))
 
             source_text = data.get("source_text")
             if source_text:
@@ -2388,15 +2615,10 @@ def _format_rp_provision_as_context(
     # ── Pattern flags ─────────────────────────────────────────────────
     pattern_flags = rp_response.get("pattern_flags", {})
     if pattern_flags:
-        flag_labels = {
-            "jcrew_pattern_detected": "J.Crew blocker pattern detected",
-            "serta_pattern_detected": "Serta pattern detected",
-            "collateral_leakage_pattern_detected": "Collateral leakage pattern detected",
-        }
         lines.append("## PATTERN FLAGS")
         lines.append("")
         for flag, value in sorted(pattern_flags.items()):
-            label = flag_labels.get(flag, flag)
+            label = _PATTERN_FLAG_LABELS.get(flag, flag)
             lines.append(f"- {label}: {'Yes' if value else 'No'}")
         lines.append("")
 
@@ -2471,6 +2693,17 @@ def _format_evidence_flat(
     return "\n".join(lines)
 
 
+def _parse_evidence_ids(raw_ids: str) -> List[str]:
+    """IDs listed in an EVIDENCE block, in order, each once.
+
+    Dedup happens while parsing (insertion-ordered dict), so an ID Claude
+    repeats doesn't produce a duplicate evidence entry downstream.
+    """
+    ids = dict.fromkeys(i.strip().strip('"').strip("'") for i in raw_ids.split(","))
+    ids.pop("", None)
+    return list(ids)
+
+
 def _parse_evidence_block(
     answer_text: str,
     rp_response: Dict,
@@ -2480,10 +2713,7 @@ def _parse_evidence_block(
 
     Returns: (clean_answer, evidence_list)
     """
-    evidence_match = re.search(
-        r'<!--\s*EVIDENCE:\s*\[([^\]]*)\]\s*-->',
-        answer_text,
-    )
+    evidence_match = _EVIDENCE_BLOCK_RE.search(answer_text)
 
     if not evidence_match:
         return answer_text, []
@@ -2493,11 +2723,7 @@ def _parse_evidence_block(
 
     # Parse question_ids
     raw_ids = evidence_match.group(1)
-    question_ids = [
-        qid.strip().strip('"').strip("'")
-        for qid in raw_ids.split(",")
-        if qid.strip()
-    ]
+    question_ids = _parse_evidence_ids(raw_ids)
 
     # Look up each question_id in the extracted data
     scalar_answers = rp_response.get("scalar_answers", {})
@@ -2524,9 +2750,9 @@ def _extract_citations_from_answer(answer_text: str) -> List[Dict[str, Any]]:
     """Extract page and section citations from the answer."""
 
     # Find all [Section X, p.Y] patterns
-    section_page_refs = re.findall(r'\[([^,\]]+),\s*p\.(\d+)\]', answer_text)
+    section_page_refs = _SECTION_PAGE_CITE_RE.findall(answer_text)
     # Find all standalone [p.XX] patterns
-    page_only_refs = re.findall(r'\[p\.(\d+)\]', answer_text)
+    page_only_refs = _PAGE_CITE_RE.findall(answer_text)
 
     citations = []
     seen_pages = set()
@@ -7,6 +7,7 @@ from typedb.driver import TransactionType
 
 from app.config import settings
 from app.services.typedb_client import typedb_client
+from app.services.graph_storage import escape_typeql
 
 router = APIRouter(tags=["Health"])
 
@@ -432,6 +433,15 @@ async def debug_reload_ontology_expanded() -> Dict[str, Any]:
     results["relations_skipped"] = relations_skipped
     results["relation_errors"] = relation_errors
 
+    # Q&A question labels and routing metadata are cached — don't wait out
+    # the TTL after a reload
+    from app.routers.deals import invalidate_question_meta_cache
+    from app.services.topic_router import on_ontology_changed
+    from app.utils.ontology import invalidate_category_cache
+    invalidate_question_meta_cache()
+    on_ontology_changed()
+    invalidate_category_cache()
+
     return results
 
 
@@ -562,6 +572,10 @@ async def debug_fix_target_fields() -> Dict[str, Any]:
     except Exception as e:
         results["verification_error"] = str(e)[:100]
 
+    # Target fields feed TopicRouter keywords
+    from app.services.topic_router import on_ontology_changed
+    on_ontology_changed()
+
     return results
 
 
@@ -701,7 +715,7 @@ If no annual de minimis exists (only individual), answer: 0""",
             # Now insert the new prompt
             tx = driver.transaction(db_name, TransactionType.WRITE)
             # Escape the prompt for TypeQL
-            escaped_prompt = new_prompt.replace('\\', '\\\\').replace('"', '\\"')
+            escaped_prompt = escape_typeql(new_prompt)
             insert_query = f'''
                 match $q isa ontology_question, has question_id "{qid}";
                 insert $q has extraction_prompt "{escaped_prompt}";
@@ -10,6 +10,7 @@ Loads all TQL files in dependency order (19 steps).
 import os
 import sys
 import logging
+from collections import deque
 from pathlib import Path
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -104,6 +105,40 @@ def load_tql_file(filepath: Path) -> str:
     return '\n'.join(lines)
 
 
+# Max unresolved query promises per transaction before waiting on the
+# oldest (same window as GraphStorage._PIPELINE_DEPTH)
+_PIPELINE_DEPTH = 64
+
+
+def _execute_batch(driver, db_name: str, statements: list) -> bool:
+    """
+    Run statements in ONE write transaction, pipelined: up to _PIPELINE_DEPTH
+    queries are submitted before waiting on the oldest. Returns True if the
+    batch committed.
+
+    Any failure rolls back the whole batch, so callers fall back to one
+    transaction per statement to skip duplicates and count errors.
+    """
+    if not statements:
+        return True
+    tx = driver.transaction(db_name, TransactionType.WRITE)
+    try:
+        in_flight = deque()
+        for stmt in statements:
+            in_flight.append(tx.query(stmt))
+            if len(in_flight) >= _PIPELINE_DEPTH:
+                in_flight.popleft().resolve()
+        while in_flight:
+            in_flight.popleft().resolve()
+        tx.commit()
+        return True
+    except Exception as e:
+        if tx.is_open():
+            tx.close()
+        logger.info(f"  Batch of {len(statements)} failed, retrying one at a time: {str(e)[:100]}")
+        return False
+
+
 def _load_mixed_tql_file(driver, db_name: str, filepath: Path):
     """
     Load a TQL file that contains both standalone insert and match-insert statements.
@@ -159,49 +194,55 @@ def _load_mixed_tql_file(driver, db_name: str, filepath: Path):
 
     flush()
 
-    # Phase 1: Execute standalone inserts one at a time
+    # Phase 1: Execute standalone inserts in one batch, else one at a time
     ins_ok = 0
     ins_skip = 0
     ins_fail = 0
-    for stmt in insert_statements:
-        tx = driver.transaction(db_name, TransactionType.WRITE)
-        try:
-            tx.query(stmt).resolve()
-            tx.commit()
-            ins_ok += 1
-        except Exception as e:
-            if tx.is_open():
-                tx.close()
-            error_msg = str(e).lower()
-            if "already" in error_msg or "duplicate" in error_msg or "unique" in error_msg:
-                ins_skip += 1
-            else:
-                ins_fail += 1
-                if ins_fail <= 3:
-                    logger.warning(f"  Insert error: {e}")
+    if _execute_batch(driver, db_name, insert_statements):
+        ins_ok = len(insert_statements)
+    else:
+        for stmt in insert_statements:
+            tx = driver.transaction(db_name, TransactionType.WRITE)
+            try:
+                tx.query(stmt).resolve()
+                tx.commit()
+                ins_ok += 1
+            except Exception as e:
+                if tx.is_open():
+                    tx.close()
+                error_msg = str(e).lower()
+                if "already" in error_msg or "duplicate" in error_msg or "unique" in error_msg:
+                    ins_skip += 1
+                else:
+                    ins_fail += 1
+                    if ins_fail <= 3:
+                        logger.warning(f"  Insert error: {e}")
 
     logger.info(f"  Inserts: {ins_ok} created, {ins_skip} existed, {ins_fail} failed ({len(insert_statements)} total)")
 
-    # Phase 2: Execute match-insert statements one at a time
+    # Phase 2: Execute match-insert statements in one batch, else one at a time
     mi_ok = 0
     mi_skip = 0
     mi_fail = 0
-    for stmt in match_insert_statements:
-        tx = driver.transaction(db_name, TransactionType.WRITE)
-        try:
-            tx.query(stmt).resolve()
-            tx.commit()
-            mi_ok += 1
-        except Exception as e:
-            if tx.is_open():
-                tx.close()
-            error_msg = str(e).lower()
-            if "already" in error_msg or "duplicate" in error_msg or "unique" in error_msg:
-                mi_skip += 1
-            else:
-                mi_fail += 1
-                if mi_fail <= 3:
-                    logger.warning(f"  Match-insert error: {e}")
+    if _execute_batch(driver, db_name, match_insert_statements):
+        mi_ok = len(match_insert_statements)
+    else:
+        for stmt in match_insert_statements:
+            tx = driver.transaction(db_name, TransactionType.WRITE)
+            try:
+                tx.query(stmt).resolve()
+                tx.commit()
+                mi_ok += 1
+            except Exception as e:
+                if tx.is_open():
+                    tx.close()
+                error_msg = str(e).lower()
+                if "already" in error_msg or "duplicate" in error_msg or "unique" in error_msg:
+                    mi_skip += 1
+                else:
+                    mi_fail += 1
+                    if mi_fail <= 3:
+                        logger.warning(f"  Match-insert error: {e}")
 
     logger.info(f"  Match-inserts: {mi_ok} created, {mi_skip} existed, {mi_fail} failed ({len(match_insert_statements)} total)")
 
@@ -214,7 +255,8 @@ def _load_multi_insert_file(driver, db_name: str, filepath: Path):
         insert $em1 isa extraction_metadata, has metadata_id "...", ...;
         insert $em2 isa extraction_metadata, has metadata_id "...", ...;
 
-    Each insert is executed as a separate transaction.
+    All inserts are tried as one batch; if that fails, each insert is
+    executed as a separate transaction.
     """
     content = filepath.read_text(encoding="utf-8")
     lines = content.split('\n')
@@ -237,22 +279,25 @@ def _load_multi_insert_file(driver, db_name: str, filepath: Path):
     loaded = 0
     skipped = 0
     failed = 0
-    for stmt in statements:
-        tx = driver.transaction(db_name, TransactionType.WRITE)
-        try:
-            tx.query(stmt).resolve()
-            tx.commit()
-            loaded += 1
-        except Exception as e:
-            if tx.is_open():
-                tx.close()
-            error_msg = str(e).lower()
-            if "already" in error_msg or "duplicate" in error_msg:
-                skipped += 1
-            else:
-                failed += 1
-                if failed <= 3:
-                    logger.warning(f"  Insert error: {e}")
+    if _execute_batch(driver, db_name, statements):
+        loaded = len(statements)
+    else:
+        for stmt in statements:
+            tx = driver.transaction(db_name, TransactionType.WRITE)
+            try:
+                tx.query(stmt).resolve()
+                tx.commit()
+                loaded += 1
+            except Exception as e:
+                if tx.is_open():
+                    tx.close()
+                error_msg = str(e).lower()
+                if "already" in error_msg or "duplicate" in error_msg:
+                    skipped += 1
+                else:
+                    failed += 1
+                    if failed <= 3:
+                        logger.warning(f"  Insert error: {e}")
 
     logger.info(f"  {loaded} inserted, {skipped} already existed, {failed} failed ({len(statements)} total)")
 
@@ -1018,8 +1018,10 @@ Return ONLY the JSON array."""
     ) -> bool:
         """Store a concept applicability with its own transaction."""
         from typedb.driver import TransactionType
+        from app.services.graph_storage import escape_typeql
 
-        escaped_text = source_text.replace('\\', '\\\\').replace('"', '\\"')[:500]
+        # Clamp before escaping so the cut can't split an escape sequence
+        escaped_text = escape_typeql(source_text[:500])
 
         tx = typedb_client.driver.transaction(
             settings.typedb_database, TransactionType.WRITE
@@ -1213,9 +1215,13 @@ Return ONLY the JSON array."""
         # ── STEP 3: Store everything to TypeDB ──────────────────────────
         logger.info(f"Storing {len(all_answers)} total answers to TypeDB")
 
+        # Commit runs in a worker thread so the event loop stays free for
+        # other deals' extraction calls meanwhile
         storage = GraphStorage(deal_id)
         extraction = ExtractionResponse(answers=all_answers)
-        storage_result = storage.store_extraction(deal_id, provision_id, extraction)
+        storage_result = await asyncio.to_thread(
+            storage.store_extraction, deal_id, provision_id, extraction
+        )
 
         # ── STEP 4: Build and return result ─────────────────────────────
         extraction_time = time.time() - start_time
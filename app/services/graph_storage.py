@@ -4,10 +4,13 @@ Graph Storage Service - V4 Graph-Native Schema
 Handles inserting extracted covenant data as entities and relations
 instead of flat attributes.
 """
+import io
+import itertools
 import json
 import logging
+import os
 import re
-import uuid
+from collections import deque
 from typing import Dict, Any, List, Optional
 from typedb.driver import TransactionType
 
@@ -17,6 +20,99 @@ from app.schemas.extraction_response import Answer, ExtractionResponse
 
 logger = logging.getLogger(__name__)
 
+# TypeQL string-literal escaping: one C-level pass via str.translate, and a
+# regex pre-check so clean text (the common case) is returned without copying.
+_ESCAPE_TABLE = str.maketrans({'\\': '\\\\', '"': '\\"', '\n': '\\n', '\r': ''})
+_NEEDS_ESCAPE = re.compile(r'[\\"\n\r]').search
+
+
+def escape_typeql(text: str) -> str:
+    """Escape text for a TypeQL string literal (backslash, quote, newline; drops CR).
+
+    Shared by every module that interpolates user/LLM text into TypeQL.
+    """
+    if not text:
+        return ""
+    if not _NEEDS_ESCAPE(text):
+        return text
+    return text.translate(_ESCAPE_TABLE)
+
+
+# Identifiers and type labels interpolated unquoted/unescaped into queries
+# (provision_id, question_id, type names from Claude's output) must match this.
+_ID_RE = re.compile(r'\A[A-Za-z0-9_\-]+\Z').match
+
+
+def _safe_id(value) -> str:
+    """Return value if it is a plain identifier, else raise ValueError.
+
+    Cheaper than escaping and also covers type labels, which cannot be quoted.
+    """
+    if not isinstance(value, str) or not _ID_RE(value):
+        raise ValueError(f"Unsafe identifier for TypeQL: {value!r}")
+    return value
+
+
+# TypeQL boolean literals, and the strings Claude uses to mean True
+_BOOL_TQL = {True: "true", False: "false"}
+_TRUTHY_STRINGS = frozenset({"true", "yes", "1"})
+
+
+# Provenance attrs owned by provision_has_answer (schema_unified.tql); used only
+# when relation introspection is unavailable, so provenance is never dropped
+_ANSWER_PROVENANCE_FALLBACK_TYPES = {
+    "source_text": "string",
+    "source_page": "long",
+    "source_section": "string",
+    "confidence": "string",
+}
+
+# provision_has_answer value slot per storage_value_type: (attribute, literal renderer).
+# Python types map onto the same slots when a question has no storage_value_type.
+_ANSWER_VALUE_ATTRS = {
+    "boolean": ("answer_boolean", lambda v: _BOOL_TQL[bool(v)]),
+    "double": ("answer_double", lambda v: str(float(v))),
+    "integer": ("answer_integer", lambda v: str(int(v))),
+    "string": ("answer_string", lambda v: f'"{escape_typeql(str(v))}"'),
+}
+_PY_TYPE_STORAGE_VALUE_TYPE = {bool: "boolean", int: "integer", float: "double"}
+
+# Fields set by SSoT seed data, not by extraction
+_SSOT_ONLY_FIELDS = frozenset({"capacity_category"})
+# Item keys that are never stored as attributes (subtype discriminator + SSoT-only)
+_NON_EXTRACTED_FIELDS = _SSOT_ONLY_FIELDS | {"type"}
+# String answers that mean "no answer"
+_NULL_ANSWER_STRINGS = frozenset({"not_found", "n/a", "none", "null"})
+# provision_id suffix → provision type (anything else is rp_provision)
+_PROVISION_SUFFIX_TYPES = {"mfn": "mfn_provision", "di": "di_provision"}
+
+# Longest string literal written to TypeDB (verbatim source_text etc.)
+_MAX_TEXT_LEN = 2000
+
+# Static query skeletons for the fixed-shape link/ensure writes, filled with
+# str.format instead of rebuilding a multi-line f-string on every call.
+_Q_PUT_PROVISION = (
+    'match $deal isa deal, has deal_id "{deal_id}"; '
+    'put $prov isa {provision_type}, has provision_id "{provision_id}";'
+)
+_Q_ENSURE_DEAL_HAS_PROVISION = (
+    'match $deal isa deal, has deal_id "{deal_id}"; '
+    '$prov isa {provision_type}, has provision_id "{provision_id}"; '
+    'not {{ (deal: $deal, provision: $prov) isa deal_has_provision; }}; '
+    'insert (deal: $deal, provision: $prov) isa deal_has_provision;'
+)
+_Q_ENSURE_PROVISION_HAS_BASKET = (
+    'match $prov isa {provision_type}, has provision_id "{provision_id}"; '
+    '$basket isa {basket_type}, has basket_id "{basket_id}"; '
+    'not {{ (provision: $prov, basket: $basket) isa provision_has_basket; }}; '
+    'insert (provision: $prov, basket: $basket) isa provision_has_basket;'
+)
+_Q_ENSURE_CAPACITY_CATEGORY = (
+    'match $b isa {entity_type}, has {key_attr} "{entity_id}"; '
+    'not {{ $b has capacity_category $existing; }}; '
+    'insert $b has capacity_category "{capacity_category}";'
+)
+
 class GraphStorage:
     """Insert extracted covenant data as graph entities and relations."""
 
@@ -24,6 +120,24 @@ class GraphStorage:
         self.deal_id = deal_id
         self.driver = typedb_client.driver
         self.db_name = settings.typedb_database
+        # Concept IIDs for match-by-iid (avoids re-resolving key attrs per insert).
+        # Per-instance: IIDs change when seed data is reloaded.
+        self._question_iids: Optional[Dict[str, str]] = None
+        self._provision_iids: Dict[str, str] = {}
+        # Write batching (begin_batch/end_batch): queued (label, query, fallback)
+        self._pending: Optional[List[tuple]] = None
+        self._batch_label = ""
+        self._batch_errors: List[tuple] = []  # (label, message)
+        # Scratch list reused by _build_single_entity_insert (one per instance;
+        # GraphStorage is used from one thread per extraction)
+        self._attr_buf: List[str] = []
+        # _gen_id suffix: random per-instance salt + counter (no syscall per ID)
+        self._id_salt = os.urandom(4).hex()
+        self._id_counter = itertools.count()
+        # Idempotent writes already done by this instance (skip re-sending them)
+        # and resolved {(provision_id, basket_type): basket_id}
+        self._ensured: set = set()
+        self._basket_id_cache: Dict[tuple, str] = {}
 
     # ═══════════════════════════════════════════════════════════════════════════
     # SCHEMA INTROSPECTION — discover entity fields from TypeDB schema
@@ -463,6 +577,8 @@ class GraphStorage:
 
         SSoT: mirrors get_attr_value_types() but for relations instead of entities.
         Used by _build_reallocation_edge_query to avoid hardcoded field maps.
+        Only a successful, non-empty introspection is cached; on failure {} is
+        returned uncached so the next call retries.
         """
         cache_key = f"__rel_attrs_{relation_type}"
         if cache_key in cls._entity_fields_cache:
@@ -483,10 +599,12 @@ class GraphStorage:
                 result[attr_name] = vt
         except Exception as e:
             logger.warning(f"Failed to introspect relation attrs for {relation_type}: {e}")
+            return {}
         finally:
             tx.close()
 
-        cls._entity_fields_cache[cache_key] = result
+        if result:
+            cls._entity_fields_cache[cache_key] = result
         logger.info(f"Introspected {len(result)} attrs for relation {relation_type}")
         return result
 
@@ -592,16 +710,17 @@ Return a single JSON object with one key: `"answers"` — an array of answer obj
 """
 
     @classmethod
-    def _prompt_footer(cls, document_text: str) -> str:
-        """Common document text + response footer."""
-        return f"""
-## DOCUMENT TEXT
-
-{document_text}
-
-## RESPONSE
+    def _write_prompt_footer(cls, buf: io.StringIO, document_text: str):
+        """Common document text + response footer.
 
-Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanation."""
+        Written straight into the prompt buffer — document_text is the full
+        agreement, so it is copied once instead of via f-string + concatenation.
+        """
+        buf.write("\n## DOCUMENT TEXT\n\n")
+        buf.write(document_text)
+        buf.write('\n\n## RESPONSE\n\n'
+                  'Return ONLY the JSON object with {"answers": [...]}. '
+                  'No markdown, no explanation.')
 
     @classmethod
     def build_entity_list_prompt(
@@ -614,20 +733,22 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
         Sends only entity extraction questions (sweep_tiers, de_minimis, etc.)
         to get full coverage of structured entities in a dedicated call.
         """
-        prompt = cls._prompt_header()
+        buf = io.StringIO()
+        write = buf.write
+        write(cls._prompt_header())
 
-        prompt += "You MUST return an answer for ALL entity_list questions below. "
-        prompt += "If no entities of that type exist, return the question with value: []\n\n"
+        write("You MUST return an answer for ALL entity_list questions below. ")
+        write("If no entities of that type exist, return the question with value: []\n\n")
 
-        prompt += "## ENTITY EXTRACTION\n\n"
-        prompt += "For each entity_list question below, return an array of entity objects.\n"
-        prompt += "Each entity object should include the listed fields plus provenance (section_reference, source_page, source_text).\n\n"
+        write("## ENTITY EXTRACTION\n\n")
+        write("For each entity_list question below, return an array of entity objects.\n")
+        write("Each entity object should include the listed fields plus provenance (section_reference, source_page, source_text).\n\n")
 
         for q in sorted(entity_list_questions, key=lambda x: x.get("display_order", 0)):
-            prompt += cls._format_entity_list_question(q)
+            write(cls._format_entity_list_question(q))
 
-        prompt += cls._prompt_footer(document_text)
-        return prompt
+        cls._write_prompt_footer(buf, document_text)
+        return buf.getvalue()
 
     @classmethod
     def build_scalar_prompt(
@@ -640,12 +761,14 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
         Sends a batch of categorized questions. Used in batched extraction
         to stay within output token limits.
         """
-        prompt = cls._prompt_header()
+        buf = io.StringIO()
+        write = buf.write
+        write(cls._prompt_header())
 
-        prompt += "You MUST answer ALL questions listed below. "
-        prompt += 'For questions where the answer cannot be found in the document, respond with value: null.\n\n'
+        write("You MUST answer ALL questions listed below. ")
+        write('For questions where the answer cannot be found in the document, respond with value: null.\n\n')
 
-        prompt += "## QUESTIONS\n\n"
+        write("## QUESTIONS\n\n")
 
         for cat_id in sorted(questions_by_cat.keys()):
             cat_questions = questions_by_cat[cat_id]
@@ -653,29 +776,29 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
                 continue
 
             cat_name = cat_questions[0].get("category_name", cat_id)
-            prompt += f"### Category {cat_id}: {cat_name} ({len(cat_questions)} questions)\n\n"
+            write(f"### Category {cat_id}: {cat_name} ({len(cat_questions)} questions)\n\n")
 
             for q in sorted(cat_questions, key=lambda x: x.get("display_order", 0)):
                 answer_type = q.get("answer_type", "string")
                 qid = q["question_id"]
                 text = q.get("question_text", "")
-                prompt += f"- **{qid}**: \"{text}\" ({answer_type})\n"
+                write(f"- **{qid}**: \"{text}\" ({answer_type})\n")
 
                 hint = q.get("extraction_prompt")
                 if hint:
-                    prompt += f"  Hint: {hint}\n"
+                    write(f"  Hint: {hint}\n")
 
                 if answer_type == "multiselect" and q.get("concept_options"):
                     opts = ", ".join(
                         f"{opt['id']} ({opt['name']})"
                         for opt in q["concept_options"]
                     )
-                    prompt += f"  Valid options: [{opts}]\n"
+                    write(f"  Valid options: [{opts}]\n")
 
-            prompt += "\n"
+            write("\n")
 
-        prompt += cls._prompt_footer(document_text)
-        return prompt
+        cls._write_prompt_footer(buf, document_text)
+        return buf.getvalue()
 
     @classmethod
     def _format_entity_list_question(cls, q: Dict) -> str:
@@ -699,12 +822,9 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
         # Introspect schema for fields
         schema_info = cls.get_entity_fields_from_schema(entity_type)
 
-        # Fields set by SSoT seed data, not by extraction
-        ssot_only_fields = {"capacity_category"}
-
         if schema_info.get("is_abstract"):
             section += f"- **This is an abstract type with subtypes.** Include a `\"type\"` field to specify the subtype.\n"
-            common = [f for f in schema_info.get("common_fields", []) if f not in ssot_only_fields]
+            common = [f for f in schema_info.get("common_fields", []) if f not in _SSOT_ONLY_FIELDS]
             if common:
                 section += f"- Common fields: {', '.join(common)}\n"
             for sub_name, sub_info in schema_info.get("subtypes", {}).items():
@@ -712,7 +832,7 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
                 if sub_fields:
                     section += f"  - **{sub_name}**: {', '.join(sub_fields)}\n"
         else:
-            fields = [f for f in schema_info.get("fields", []) if f not in ssot_only_fields]
+            fields = [f for f in schema_info.get("fields", []) if f not in _SSOT_ONLY_FIELDS]
             if fields:
                 section += f"- Fields: {', '.join(fields)}\n"
 
@@ -1043,8 +1163,39 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
     def _provision_type_from_id(provision_id: str) -> str:
         """Determine provision type from provision_id suffix convention."""
         suffix = provision_id.rsplit("_", 1)[-1]
-        suffix_map = {"mfn": "mfn_provision", "di": "di_provision"}
-        return suffix_map.get(suffix, "rp_provision")
+        return _PROVISION_SUFFIX_TYPES.get(suffix, "rp_provision")
+
+    # {(entity_type, prov_type): match-insert template or None}
+    _single_instance_template_cache: Dict[tuple, Optional[str]] = {}
+
+    def _get_single_instance_template(self, entity_type: str, prov_type: str) -> Optional[str]:
+        """Match-insert template for a single-instance entity + provision relation.
+
+        Relation/roles and key attr are schema lookups that never change per
+        type, so the query skeleton is built once; callers fill in
+        {provision_id}, {entity_id} and {attrs}.
+        """
+        cache_key = (entity_type, prov_type)
+        if cache_key in self._single_instance_template_cache:
+            return self._single_instance_template_cache[cache_key]
+
+        template = None
+        relation_info = self._load_entity_relation_map().get(entity_type)
+        key_attr = self.get_key_attr_for_entity(entity_type)
+        if not relation_info:
+            logger.warning(f"No relation mapping for single-instance entity: {entity_type}")
+        elif not key_attr:
+            logger.warning(f"No @key attribute found for {entity_type}")
+        else:
+            relation_type, prov_role, entity_role = relation_info
+            template = (
+                f'match $prov isa {prov_type}, has provision_id "{{provision_id}}"; '
+                f'insert $entity isa {entity_type}, has {key_attr} "{{entity_id}}"{{attrs}}; '
+                f'({prov_role}: $prov, {entity_role}: $entity) isa {relation_type};'
+            )
+            # Only cache successes so a transient schema-load failure can recover
+            self._single_instance_template_cache[cache_key] = template
+        return template
 
     def _create_single_instance_entity(self, provision_id: str, entity_type: str,
                                         source_text: str = None, source_page: int = None,
@@ -1055,58 +1206,32 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
         Propagates provenance attributes (source_text, source_page, section_reference)
         from the _exists answer onto the entity.
         """
-        entity_relation_map = self._load_entity_relation_map()
-        relation_info = entity_relation_map.get(entity_type)
-        if not relation_info:
-            logger.warning(f"No relation mapping for single-instance entity: {entity_type}")
-            return
-
-        relation_type, prov_role, entity_role = relation_info
-        key_attr = self.get_key_attr_for_entity(entity_type)
-        if not key_attr:
-            logger.warning(f"No @key attribute found for {entity_type}")
+        prov_type = self._provision_type_from_id(provision_id)
+        template = self._get_single_instance_template(entity_type, prov_type)
+        if not template:
             return
 
         entity_id = f"{provision_id}_{entity_type}"
-        prov_type = self._provision_type_from_id(provision_id)
 
         # Build provenance attributes (only for attrs the entity type actually owns)
         attr_types = self.get_attr_value_types(entity_type)
-        prov_attrs = []
-        if source_text and "source_text" in attr_types:
-            prov_attrs.append(f'has source_text "{self._escape(source_text[:2000])}"')
-        if source_page is not None and "source_page" in attr_types:
-            prov_attrs.append(f'has source_page {source_page}')
-        if section_reference and "section_reference" in attr_types:
-            prov_attrs.append(f'has section_reference "{self._escape(section_reference)}"')
-
-        prov_str = ""
-        if prov_attrs:
-            prov_str = ",\n                    ".join([""] + prov_attrs)  # leading comma
-
-        query = f'''
-            match
-                $prov isa {prov_type}, has provision_id "{provision_id}";
-            insert
-                $entity isa {entity_type},
-                    has {key_attr} "{entity_id}"{prov_str};
-                ({prov_role}: $prov, {entity_role}: $entity) isa {relation_type};
-        '''
+        prov_attrs = self._render_attrs({
+            "source_text": source_text,
+            "source_page": source_page,
+            "section_reference": section_reference,
+        }, attr_types)
+        cap_attr = self._capacity_category_attr(entity_type, attr_types)
+        if cap_attr:
+            prov_attrs.append(cap_attr)
+
+        query = template.format(
+            provision_id=provision_id,
+            entity_id=entity_id,
+            attrs="".join(", " + a for a in prov_attrs),  # leading comma
+        )
         try:
             self._execute_query(query)
-            logger.info(f"Created {entity_type}: {entity_id} (provenance: {len(prov_attrs)} attrs)")
-
-            # Set capacity_category from SSoT classification
-            cap_cat = self._load_capacity_classifications().get(entity_type)
-            if cap_cat:
-                try:
-                    self._execute_query(f'''
-                        match $b isa {entity_type}, has {key_attr} "{entity_id}";
-                            not {{ $b has capacity_category $existing; }};
-                        insert $b has capacity_category "{cap_cat}";
-                    ''')
-                except Exception:
-                    pass  # Already set or type doesn't support it
+            logger.info(f"Created {entity_type}: {entity_id} (attrs: {len(prov_attrs)})")
         except Exception as e:
             logger.warning(f"Failed to create {entity_type}: {e}")
 
@@ -1119,35 +1244,95 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
         if value is None:
             return
 
-        key_attr = self.get_key_attr_for_entity(entity_type)
-        if not key_attr:
+        prepared = self._get_set_attr_template(entity_type, attr_name)
+        if not prepared:
             return
+        template, value_type, keyed_by_provision = prepared
 
         # Provision subtypes use provision_id directly as their key;
         # child entities use {provision_id}_{entity_type} convention.
-        if key_attr == "provision_id":
-            entity_id = provision_id
-        else:
-            entity_id = f"{provision_id}_{entity_type}"
+        entity_id = provision_id if keyed_by_provision else f"{provision_id}_{entity_type}"
 
         # Use shared schema-based coercion (SSoT)
-        attr_types = self.get_attr_value_types(entity_type)
-        tql_value = self._format_tql_value(value, attr_types.get(attr_name))
+        tql_value = self._format_tql_value(value, value_type)
         if tql_value is None:
             logger.warning(f"Cannot coerce {value!r} for {entity_type}.{attr_name}")
             return
 
-        query = f'''
-            match
-                $entity isa {entity_type}, has {key_attr} "{entity_id}";
-            insert
-                $entity has {attr_name} {tql_value};
-        '''
+        query = template.format(entity_id=entity_id, value=tql_value)
         try:
             self._execute_query(query)
         except Exception as e:
             logger.debug(f"Could not set {entity_type}.{attr_name}: {e}")
 
+    def _set_entity_attributes(self, provision_id: str, entity_type: str,
+                               values: Dict[str, Any]):
+        """Set several attributes on one single-instance entity with one match.
+
+        Falls back to one _set_entity_attribute-style query per attribute if the
+        combined insert fails, so one bad attribute doesn't drop the rest.
+        """
+        key_attr = self.get_key_attr_for_entity(entity_type)
+        if not key_attr:
+            return
+        entity_id = provision_id if key_attr == "provision_id" else f"{provision_id}_{entity_type}"
+
+        clauses = []
+        singles = []
+        for attr_name, value in values.items():
+            if value is None:
+                continue
+            prepared = self._get_set_attr_template(entity_type, attr_name)
+            if not prepared:
+                continue
+            template, value_type, _ = prepared
+            tql_value = self._format_tql_value(value, value_type)
+            if tql_value is None:
+                logger.warning(f"Cannot coerce {value!r} for {entity_type}.{attr_name}")
+                continue
+            clauses.append(f"has {attr_name} {tql_value}")
+            singles.append(template.format(entity_id=entity_id, value=tql_value))
+
+        if not clauses:
+            return
+        if len(singles) == 1:
+            query, fallback = singles[0], None
+        else:
+            query = (f'match $entity isa {entity_type}, has {key_attr} "{entity_id}"; '
+                     f'insert $entity {", ".join(clauses)};')
+            fallback = singles
+        for err in self._execute_with_fallback(query, fallback):
+            logger.debug(f"Could not set {entity_type} attribute: {err}")
+
+    # {(entity_type, attr_name): (template, value_type, keyed_by_provision)}
+    _set_attr_template_cache: Dict[tuple, tuple] = {}
+
+    def _get_set_attr_template(self, entity_type: str, attr_name: str) -> Optional[tuple]:
+        """Query template for _set_entity_attribute, built once per (type, attr).
+
+        The TypeDB 3.x driver has no server-side prepared statements, so this
+        caches the client-side work: key-attr and value-type lookups plus the
+        query skeleton, leaving only the id and value to substitute.
+        """
+        cache_key = (entity_type, attr_name)
+        cached = self._set_attr_template_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        key_attr = self.get_key_attr_for_entity(entity_type)
+        if not key_attr:
+            return None
+        template = (
+            f'match $entity isa {entity_type}, has {key_attr} "{{entity_id}}"; '
+            f'insert $entity has {attr_name} {{value}};'
+        )
+        value_type = self.get_attr_value_types(entity_type).get(attr_name)
+        prepared = (template, value_type, key_attr == "provision_id")
+        # Only cache successes so a transient schema-load failure can recover
+        if value_type is not None:
+            self._set_attr_template_cache[cache_key] = prepared
+        return prepared
+
     # ═══════════════════════════════════════════════════════════════════════════
     # UNIFIED STORAGE — store_extraction()
     # ═══════════════════════════════════════════════════════════════════════════
@@ -1382,7 +1567,7 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
         Called AFTER _store_entity_list() so all basket entities exist.
         Reads source_basket_type / target_basket_type from the RAW answer JSON
         (these fields are NOT schema attributes on basket_reallocation — they are
-        dropped by _store_single_entity(). We read them from the original answer.value.)
+        dropped by _build_single_entity_insert(). We read them from the original answer.value.)
 
         Batches all inserts in a single WRITE transaction to avoid gRPC congestion.
         """
@@ -1399,7 +1584,7 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
                 continue
             for field in ("source_basket_type", "target_basket_type"):
                 bt = item.get(field)
-                if bt and bt in cross_covenant:
+                if isinstance(bt, str) and bt in cross_covenant:
                     cross_baskets_needed.add(bt)
 
         for basket_type in cross_baskets_needed:
@@ -1418,6 +1603,8 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
             self._ensure_cross_basket(cross_prov_id, prov_type, basket_type, basket_id, ref_item)
 
         # Phase B: Resolve all basket IDs and batch edge inserts
+        # (one read for every basket on the provision; per-type fallback on misses)
+        self._prefetch_basket_ids(provision_id)
         edge_queries = []
         for item in raw_reallocation_items:
             if not isinstance(item, dict):
@@ -1430,6 +1617,13 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
                 logger.warning(f"Reallocation missing source/target type: "
                              f"{item.get('reallocation_source', '?')}")
                 continue
+            try:
+                # Type names come from Claude's output and are used as type labels
+                _safe_id(source_type)
+                _safe_id(target_type)
+            except ValueError as e:
+                logger.warning(f"Skipping reallocation edge: {e}")
+                continue
 
             source_id = self._resolve_basket_id(deal_id, provision_id, source_type, cross_covenant)
             target_id = self._resolve_basket_id(deal_id, provision_id, target_type, cross_covenant)
@@ -1445,19 +1639,43 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
             if query:
                 edge_queries.append(query)
 
-        # Execute all edge inserts in one WRITE transaction
+        # Execute all edge inserts in one pipelined WRITE transaction
         if edge_queries:
-            tx = typedb_client.driver.transaction(settings.typedb_database, TransactionType.WRITE)
             try:
-                for q in edge_queries:
-                    tx.query(q).resolve()
-                tx.commit()
+                self._execute_queries(edge_queries)
                 logger.info(f"Committed {len(edge_queries)} reallocation edges for {provision_id}")
             except Exception as e:
                 logger.error(f"Failed to commit reallocation edges: {e}")
-                tx.close()
                 raise
 
+    def _prefetch_basket_ids(self, provision_id: str):
+        """Resolve every basket on a provision in one READ, filling _basket_id_cache.
+
+        Keyed by exact type label; _resolve_basket_id falls back to its
+        per-type polymorphic query for anything not found here.
+        """
+        prefetch_key = ("basket_ids", provision_id)
+        if prefetch_key in self._ensured:
+            return
+
+        tx = self.driver.transaction(self.db_name, TransactionType.READ)
+        try:
+            query = (
+                f'match $prov isa provision, has provision_id "{provision_id}"; '
+                f'$rel isa provision_has_extracted_entity, links ($prov, $b); '
+                f'$b isa! $t, has basket_id $bid; '
+                f'select $t, $bid;'
+            )
+            for row in tx.query(query).resolve().as_concept_rows():
+                label = row.get("t").get_label()
+                bid = row.get("bid").as_attribute().get_value()
+                self._basket_id_cache.setdefault((provision_id, label), bid)
+            self._ensured.add(prefetch_key)
+        except Exception as e:
+            logger.warning(f"Basket ID prefetch failed for {provision_id}: {e}")
+        finally:
+            tx.close()
+
     def _resolve_basket_id(self, deal_id: str, provision_id: str,
                            basket_type: str, cross_covenant: Dict[str, str]) -> Optional[str]:
         """Resolve a basket type name to its actual @key ID in TypeDB.
@@ -1476,6 +1694,10 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
             cross_prov_id = f"{deal_id}_{prov_type.replace('_provision', '')}"
             return f"{cross_prov_id}_{basket_type}"
 
+        cache_key = (provision_id, basket_type)
+        if cache_key in self._basket_id_cache:
+            return self._basket_id_cache[cache_key]
+
         # Polymorphic query: find basket connected to provision via ANY
         # sub-relation of provision_has_extracted_entity
         tx = typedb_client.driver.transaction(settings.typedb_database, TransactionType.READ)
@@ -1491,6 +1713,7 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
             if rows:
                 bid = rows[0].get("bid").as_attribute().get_value()
                 logger.debug(f"Resolved {basket_type} -> {bid}")
+                self._basket_id_cache[cache_key] = bid
                 return bid
 
             logger.warning(f"No {basket_type} found on provision {provision_id}")
@@ -1506,29 +1729,32 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
 
         Uses put for the entity (verified in TypeDB 3.x).
         Uses match-not-insert for the relation (put for relations is unverified).
+        Both statements run in one write transaction.
+        Skipped if this instance already ensured the same provision.
         """
+        ensure_key = ("provision", provision_id)
+        if ensure_key in self._ensured:
+            return
+        params = {"deal_id": deal_id, "provision_type": provision_type,
+                  "provision_id": provision_id}
         try:
-            # Ensure the provision entity exists (put is safe for entities)
-            self._execute_query(f'''
-                match
-                    $deal isa deal, has deal_id "{deal_id}";
-                put $prov isa {provision_type},
-                    has provision_id "{provision_id}";
-            ''')
-
-            # Ensure the deal_has_provision relation exists
-            self._execute_query(f'''
-                match
-                    $deal isa deal, has deal_id "{deal_id}";
-                    $prov isa {provision_type}, has provision_id "{provision_id}";
-                    not {{ (deal: $deal, provision: $prov) isa deal_has_provision; }};
-                insert
-                    (deal: $deal, provision: $prov) isa deal_has_provision;
-            ''')
+            self._execute_queries([
+                # Ensure the provision entity exists (put is safe for entities)
+                _Q_PUT_PROVISION.format(**params),
+                # Ensure the deal_has_provision relation exists
+                _Q_ENSURE_DEAL_HAS_PROVISION.format(**params),
+            ])
+            self._ensured.add(ensure_key)
             logger.info(f"Ensured {provision_type}: {provision_id}")
         except Exception as e:
             logger.warning(f"Error ensuring cross-provision {provision_id}: {e}")
 
+    # (reallocation item key, cross-covenant basket attr) — value types come from schema
+    _CROSS_BASKET_ATTR_MAP = (
+        ("reallocation_amount_usd", "basket_amount_usd"),
+        ("reallocation_grower_pct", "basket_grower_pct"),
+    )
+
     def _ensure_cross_basket(self, provision_id: str, provision_type: str,
                              basket_type: str, basket_id: str, item: Dict):
         """Create a cross-covenant basket entity if it doesn't exist.
@@ -1538,51 +1764,57 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
         not where the basket itself lives (e.g., 6.03(y)). The basket entity's
         section_reference will be populated when full investment covenant extraction is built.
         """
+        ensure_key = ("basket", provision_id, basket_id)
+        if ensure_key in self._ensured:
+            return
         try:
             attrs = [f'has basket_id "{basket_id}"']
 
             # Transfer dollar amount and grower from reallocation data
-            amount = item.get("reallocation_amount_usd")
-            if amount is not None:
-                attrs.append(f'has basket_amount_usd {amount}')
-            else:
+            if item.get("reallocation_amount_usd") is None:
                 logger.warning(f"reallocation_amount_usd missing for {basket_type} — "
                              f"cross-covenant basket will lack basket_amount_usd")
-            grower = item.get("reallocation_grower_pct")
-            if grower is not None:
-                attrs.append(f'has basket_grower_pct {grower}')
+            basket_attr_types = self.get_attr_value_types(basket_type)
+            attrs.extend(self._render_attrs(
+                {basket_attr: item.get(item_key)
+                 for item_key, basket_attr in self._CROSS_BASKET_ATTR_MAP},
+                basket_attr_types,
+            ))
             # Intentionally NOT setting section_reference or source_text here.
             # Those describe the reallocation clause, not the basket's own location.
 
-            attrs_str = ",\n                ".join(attrs)
-
-            # Entity put (safe) + relation match-not-insert (separate calls)
-            self._execute_query(f'''
-                put $basket isa {basket_type},
-                    {attrs_str};
-            ''')
+            cap_attr = self._capacity_category_attr(basket_type, basket_attr_types)
+            if cap_attr:
+                attrs.append(cap_attr)
+            attrs_str = ",\n                    ".join(attrs)
 
-            self._execute_query(f'''
+            # New basket: create + link + capacity_category in one match-insert,
+            # guarded on the basket not existing yet.
+            queries = [f'''
                 match
                     $prov isa {provision_type}, has provision_id "{provision_id}";
-                    $basket isa {basket_type}, has basket_id "{basket_id}";
-                    not {{ (provision: $prov, basket: $basket) isa provision_has_basket; }};
+                    not {{ $existing isa {basket_type}, has basket_id "{basket_id}"; }};
                 insert
+                    $basket isa {basket_type},
+                    {attrs_str};
                     (provision: $prov, basket: $basket) isa provision_has_basket;
-            ''')
+            ''']
+
+            # Basket already existed (e.g. from an earlier extraction): the insert
+            # above matched nothing, so only add the link / capacity_category if missing.
+            queries.append(_Q_ENSURE_PROVISION_HAS_BASKET.format(
+                provision_type=provision_type, provision_id=provision_id,
+                basket_type=basket_type, basket_id=basket_id,
+            ))
+            if cap_attr:
+                queries.append(_Q_ENSURE_CAPACITY_CATEGORY.format(
+                    entity_type=basket_type, key_attr="basket_id", entity_id=basket_id,
+                    capacity_category=self._escape(self._load_capacity_classifications()[basket_type]),
+                ))
+
+            self._execute_queries(queries)
+            self._ensured.add(ensure_key)
             logger.info(f"Ensured cross-covenant basket: {basket_type} ({basket_id})")
-
-            # Set capacity_category from SSoT classification
-            cap_cat = self._load_capacity_classifications().get(basket_type)
-            if cap_cat:
-                try:
-                    self._execute_query(f'''
-                        match $b isa {basket_type}, has basket_id "{basket_id}";
-                            not {{ $b has capacity_category $existing; }};
-                        insert $b has capacity_category "{cap_cat}";
-                    ''')
-                except Exception:
-                    pass  # Already set or type doesn't support it
         except Exception as e:
             logger.warning(f"Error ensuring cross-basket {basket_type}: {e}")
 
@@ -1602,32 +1834,28 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
             # Introspect relation attributes from schema
             attr_types = self._get_relation_attr_types("basket_reallocates_to")
 
-            rel_attrs = []
-            for attr_name, vtype in attr_types.items():
-                val = item.get(attr_name)
-                if val is None:
-                    continue
-                if vtype == "boolean":
-                    rel_attrs.append(f'has {attr_name} {str(val).lower()}')
-                elif vtype in ("long", "double"):
-                    rel_attrs.append(f'has {attr_name} {val}')
-                elif vtype == "string":
-                    rel_attrs.append(f'has {attr_name} "{self._escape(str(val)[:2000])}"')
+            # Walk the (sparse) item once; schema lookup decides what is stored.
+            # Booleans/numbers are coerced (never interpolated raw); strings escaped.
+            # capacity_effect is structural (set below), never taken from the item.
+            formatted = (
+                (attr_name, self._format_tql_value(val, attr_types[attr_name]))
+                for attr_name, val in item.items()
+                if val is not None and attr_name in attr_types and attr_name != "capacity_effect"
+            )
+            rel_attrs_str = "".join(
+                f',\n                has {attr_name} {tql_value}'
+                for attr_name, tql_value in formatted if tql_value is not None
+            )
 
             # capacity_effect is structural metadata, not extracted from the document.
             # "additive" = source's cap becomes additional capacity for the target.
-            rel_attrs.append(f'has capacity_effect "additive"')
-
-            rel_attrs_str = ""
-            if rel_attrs:
-                rel_attrs_str = ",\n                " + ",\n                ".join(rel_attrs)
-
             return f'''
                 match
                     $source isa {source_type}, has {source_key} "{source_id}";
                     $target isa {target_type}, has {target_key} "{target_id}";
                 insert
-                    (source_basket: $source, target_basket: $target) isa basket_reallocates_to{rel_attrs_str};
+                    (source_basket: $source, target_basket: $target) isa basket_reallocates_to{rel_attrs_str},
+                has capacity_effect "additive";
             '''
         except Exception as e:
             logger.warning(f"Error building edge query: {e}")
@@ -1658,6 +1886,10 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
         2. entity_list → create multi-instance entities
         3. scalar → store flat answer + populate entity attributes via annotations
         4. multiselect → store flat answer + set entity booleans via concept routing
+
+        Writes from all phases are batched (begin_batch/end_batch); write
+        failures surface in results["errors"] after the batch flushes, and
+        the counts only include writes that committed.
         """
         results = {
             "provision_id": provision_id,
@@ -1665,6 +1897,15 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
             "answers_stored": 0,
             "errors": [],
         }
+        _safe_id(deal_id)
+        _safe_id(provision_id)
+
+        # Fast path: nothing to store (short/empty provisions) — skip the
+        # routing-table loads, the entity_list read and the batch entirely
+        answers = [a for a in response.answers if a.value is not None]
+        if not answers:
+            logger.info(f"No answers with values for {provision_id} — nothing to store")
+            return results
 
         # Load routing tables (cached after first call)
         q_to_entity = self._load_question_to_entity_map()
@@ -1678,26 +1919,26 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
         multiselect_answers = []  # multiselect arrays
 
         # Build set of known entity_list question IDs for validation
+        # (only needed when some answer claims entity_list)
         known_el_qids = set()
-        tx = typedb_client.driver.transaction(settings.typedb_database, TransactionType.READ)
-        try:
-            result = tx.query('''
-                match $q isa ontology_question,
-                    has question_id $qid,
-                    has answer_type "entity_list";
-                select $qid;
-            ''').resolve()
-            for row in result.as_concept_rows():
-                known_el_qids.add(self._get_attr(row, "qid"))
-        except Exception as e:
-            logger.warning(f"Could not load entity_list question IDs: {e}")
-        finally:
-            if tx.is_open():
-                tx.close()
+        if any(a.answer_type == "entity_list" for a in answers):
+            tx = typedb_client.driver.transaction(settings.typedb_database, TransactionType.READ)
+            try:
+                result = tx.query('''
+                    match $q isa ontology_question,
+                        has question_id $qid,
+                        has answer_type "entity_list";
+                    select $qid;
+                ''').resolve()
+                for row in result.as_concept_rows():
+                    known_el_qids.add(self._get_attr(row, "qid"))
+            except Exception as e:
+                logger.warning(f"Could not load entity_list question IDs: {e}")
+            finally:
+                if tx.is_open():
+                    tx.close()
 
-        for answer in response.answers:
-            if answer.value is None:
-                continue
+        for answer in answers:
             if answer.answer_type == "entity_list":
                 if answer.question_id in known_el_qids:
                     entity_list_answers.append(answer)
@@ -1728,60 +1969,92 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
             f"{len(scalar_answers)} scalar, {len(multiselect_answers)} multiselect"
         )
 
-        # Phase 1: Create single-instance entities from _exists=True
-        for answer in exists_answers:
-            try:
-                entity_type = q_to_entity[answer.question_id][0]
-                # Use explicit section_reference from extraction, fall back to regex
-                section_ref = answer.section_reference
-                if not section_ref and answer.source_text:
-                    section_ref = self._extract_section_ref(answer.source_text)
-                self._create_single_instance_entity(
-                    provision_id, entity_type,
-                    source_text=answer.source_text,
-                    source_page=answer.source_page,
-                    section_reference=section_ref,
-                )
-                results["entities_created"] += 1
-            except Exception as e:
-                et = q_to_entity.get(answer.question_id, ("?",))[0]
-                results["errors"].append(f"create_{et}: {str(e)[:100]}")
+        # All phases write through one batch: writes are queued and committed
+        # in a few large transactions instead of one commit per statement.
+        # Processing order is preserved (chunks commit in queue order).
+        # Counts are taken at queue time; each counted write is queued under
+        # its own batch label so writes that fail on flush can be taken back.
+        answer_labels = set()                  # labels of flat-answer writes
+        entity_labels: Dict[str, int] = {}     # label → entities queued under it
+        self.begin_batch()
+        try:
+            # Phase 1: Create single-instance entities from _exists=True
+            for answer in exists_answers:
+                try:
+                    entity_type = q_to_entity[answer.question_id][0]
+                    self._batch_label = f"create_{entity_type}"
+                    # Use explicit section_reference from extraction, fall back to regex
+                    section_ref = answer.section_reference
+                    if not section_ref and answer.source_text:
+                        section_ref = self._extract_section_ref(answer.source_text)
+                    self._create_single_instance_entity(
+                        provision_id, entity_type,
+                        source_text=answer.source_text,
+                        source_page=answer.source_page,
+                        section_reference=section_ref,
+                    )
+                    results["entities_created"] += 1
+                    entity_labels[self._batch_label] = entity_labels.get(self._batch_label, 0) + 1
+                except Exception as e:
+                    et = q_to_entity.get(answer.question_id, ("?",))[0]
+                    results["errors"].append(f"create_{et}: {str(e)[:100]}")
 
-        # Phase 2: Create multi-instance entities from entity_list
-        # (reallocations are stored as relations, not entities — handled inside _store_entity_list)
-        for answer in entity_list_answers:
-            try:
-                count = self._store_entity_list(provision_id, answer, deal_id=deal_id)
-                results["entities_created"] += count
-            except Exception as e:
-                results["errors"].append(f"{answer.question_id}: {str(e)[:100]}")
+            # Phase 2: Create multi-instance entities from entity_list
+            # (reallocations are stored as relations, not entities — handled inside _store_entity_list)
+            for answer in entity_list_answers:
+                self._batch_label = answer.question_id
+                try:
+                    count = self._store_entity_list(provision_id, answer, deal_id=deal_id)
+                    results["entities_created"] += count
+                    entity_labels[answer.question_id] = count
+                except Exception as e:
+                    results["errors"].append(f"{answer.question_id}: {str(e)[:100]}")
 
-        # Phase 3: Store scalar answers (flat + entity attribute if annotated)
-        for answer in scalar_answers:
-            try:
-                self._store_flat_answer(provision_id, answer)
-                results["answers_stored"] += 1
-                # Also populate entity attribute if annotation exists & single-instance type
-                routing = q_to_entity.get(answer.question_id)
-                if routing:
-                    entity_type, attr_name = routing
-                    if attr_name not in ("_exists", "_entity_list") and entity_type not in entity_list_types:
-                        self._set_entity_attribute(provision_id, entity_type, attr_name, answer.value)
-            except Exception as e:
-                results["errors"].append(f"{answer.question_id}: {str(e)[:100]}")
+            # Phase 3: Store scalar answers (flat + entity attribute if annotated)
+            for answer in scalar_answers:
+                self._batch_label = answer.question_id
+                try:
+                    self._store_flat_answer(provision_id, answer)
+                    results["answers_stored"] += 1
+                    answer_labels.add(answer.question_id)
+                    # Also populate entity attribute if annotation exists & single-instance type
+                    routing = q_to_entity.get(answer.question_id)
+                    if routing:
+                        entity_type, attr_name = routing
+                        if attr_name not in ("_exists", "_entity_list") and entity_type not in entity_list_types:
+                            self._batch_label = f"{answer.question_id} → {entity_type}.{attr_name}"
+                            self._set_entity_attribute(provision_id, entity_type, attr_name, answer.value)
+                except Exception as e:
+                    results["errors"].append(f"{answer.question_id}: {str(e)[:100]}")
 
-        # Phase 4: Store multiselect answers (flat + entity booleans via concept routing)
-        for answer in multiselect_answers:
-            try:
-                self._store_flat_answer(provision_id, answer)
-                results["answers_stored"] += 1
-                if isinstance(answer.value, list):
-                    for concept_id in answer.value:
-                        routings = concept_routing.get(concept_id, [])
-                        for entity_type, attr_name in routings:
-                            self._set_entity_attribute(provision_id, entity_type, attr_name, True)
-            except Exception as e:
-                results["errors"].append(f"{answer.question_id}: {str(e)[:100]}")
+            # Phase 4: Store multiselect answers (flat + entity booleans via concept routing)
+            for answer in multiselect_answers:
+                self._batch_label = answer.question_id
+                try:
+                    self._store_flat_answer(provision_id, answer)
+                    results["answers_stored"] += 1
+                    answer_labels.add(answer.question_id)
+                    if isinstance(answer.value, list):
+                        # Group routed booleans per entity so each entity is matched once
+                        by_entity: Dict[str, Dict[str, Any]] = {}
+                        for concept_id in answer.value:
+                            for entity_type, attr_name in concept_routing.get(concept_id, []):
+                                by_entity.setdefault(entity_type, {})[attr_name] = True
+                        for entity_type, attr_values in by_entity.items():
+                            self._batch_label = f"{answer.question_id} → {entity_type}"
+                            self._set_entity_attributes(provision_id, entity_type, attr_values)
+                except Exception as e:
+                    results["errors"].append(f"{answer.question_id}: {str(e)[:100]}")
+        finally:
+            failures = self.end_batch()
+            for msgs in failures.values():
+                results["errors"].extend(msgs)
+
+        # Take back counts for writes that failed when the batch flushed
+        for label, msgs in failures.items():
+            if label in answer_labels:
+                results["answers_stored"] -= 1
+            results["entities_created"] -= min(len(msgs), entity_labels.get(label, 0))
 
         logger.info(
             f"Extraction stored for {deal_id}: "
@@ -1804,6 +2077,9 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
 
         # Special handling: reallocation data stored as relations, not entities
         if answer.question_id == "rp_el_reallocations" and deal_id:
+            # Edge wiring reads basket IDs back from TypeDB — commit queued
+            # entity writes first so those reads see them.
+            self._flush_batch()
             try:
                 self.wire_reallocation_edges(deal_id, provision_id, answer.value)
                 return len(answer.value)
@@ -1825,20 +2101,37 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
             logger.error(f"No relation config for {target_relation_type}")
             return 0
 
-        count = 0
+        # One match-insert for the whole answer: $prov is matched once and every
+        # item is inserted + linked in the same insert clause. Falls back to one
+        # query per item if the grouped insert fails.
+        inserts = []
+        singles = []
         for i, item in enumerate(answer.value):
             if not isinstance(item, dict):
                 continue
             try:
-                self._store_single_entity(
+                insert = self._build_single_entity_insert(
                     provision_id, target_entity_type, target_relation_type,
-                    config, item, i
+                    config, item, i, entity_var=f"$e{i}",
                 )
-                count += 1
             except Exception as e:
-                logger.warning(f"Failed to store entity {answer.question_id}[{i}]: {e}")
+                logger.warning(f"Failed to build entity {answer.question_id}[{i}]: {e}")
+                continue
+            if insert:
+                inserts.append(insert)
+                singles.append(f"match {config['parent_match']} insert {insert}")
 
-        return count
+        if not inserts:
+            return 0
+        if len(inserts) == 1:
+            query, fallback = singles[0], None
+        else:
+            query = f"match {config['parent_match']} insert {' '.join(inserts)}"
+            fallback = singles
+        errors = self._execute_with_fallback(query, fallback)
+        for err in errors:
+            logger.warning(f"Failed to store entity for {answer.question_id}: {err}")
+        return len(inserts) - len(errors)
 
     # Cache for entity_list question metadata
     _el_question_meta_cache: Dict[str, Dict] = {}
@@ -1872,7 +2165,7 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
             tx.close()
         return None
 
-    def _store_single_entity(
+    def _build_single_entity_insert(
         self,
         provision_id: str,
         target_entity_type: str,
@@ -1880,15 +2173,95 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
         config: Dict,
         item: Dict,
         index: int,
-    ):
-        """Store a single entity from an entity_list answer."""
+        entity_var: str = "$entity",
+    ) -> Optional[str]:
+        """Build the insert statements (entity + relation to the config's parent var)
+        for one entity_list item. entity_var lets several items share one insert.
+        """
         # Determine actual entity type (may be subtype for abstract types)
-        actual_type = target_entity_type
+        # and its @key — resolved once per (type, declared subtype), not per item
         schema_info = self.get_entity_fields_from_schema(target_entity_type)
+        declared_type = item.get("type", "") if schema_info.get("is_abstract") else ""
+        if not isinstance(declared_type, str):
+            declared_type = ""
+        actual_type, key_attr = self._resolve_entity_subtype(
+            target_entity_type, declared_type, schema_info
+        )
+        if not key_attr:
+            logger.error(f"No @key found for {actual_type}")
+            return None
+
+        # Generate entity ID
+        entity_id = f"{provision_id}_{actual_type}_{index}"
+
+        # Build attribute list in the reusable per-instance buffer (joined into a
+        # new string below before anything else can touch it)
+        attrs = self._attr_buf
+        attrs.clear()
+        attrs.append(f'has {key_attr} "{entity_id}"')
+
+        # Get expected value types from schema for type coercion
+        attr_types = self.get_attr_value_types(actual_type)
+        if not attr_types:
+            logger.error(f"No schema type info for {actual_type} — cannot store entity")
+            return None
+        if index == 0:
+            logger.info(f"Type map for {actual_type}: {len(attr_types)} attrs — {attr_types}")
+
+        # Hot loop (every field of every item): walk the precompiled plan for
+        # this item shape, so only stored fields are visited and the
+        # 'has <field> ' prefix is already built
+        plan = self._get_item_render_plan(
+            target_entity_type, actual_type, schema_info, tuple(item))
+        format_value = self._format_tql_value
+        append = attrs.append
+        for field_name, value_type, prefix in plan:
+            value = item[field_name]
+            if value is None:
+                continue
+            formatted = format_value(value, value_type)
+            if formatted is not None:
+                append(prefix + formatted)
+
+        # capacity_category from SSoT classification, set in the same insert
+        cap_attr = self._capacity_category_attr(actual_type, attr_types)
+        if cap_attr:
+            attrs.append(cap_attr)
+
+        # Per-item sample is debug-only: the f-string would otherwise slice and
+        # repr the fragment list for every item even when nobody reads it
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Entity {actual_type}[{index}] attrs sample: {attrs[:4]}")
+
+        # One pre-sized join over the fragment list — str.join computes the
+        # total length first, so no intermediate concatenations are built
+        attrs_str = ", ".join(attrs)
+
+        roles = config["roles"]
+        parent_var = config.get("parent_var", "$prov")
 
+        # Single-line statements (once per entity_list item)
+        return (f"{entity_var} isa {actual_type}, {attrs_str}; "
+                f"({roles[0]}: {parent_var}, {roles[1]}: {entity_var}) isa {target_relation_type};")
+
+    # {(target_entity_type, declared_type): (actual_type, key_attr)}
+    _subtype_resolution_cache: Dict[tuple, tuple] = {}
+
+    def _resolve_entity_subtype(self, target_entity_type: str, declared_type: str,
+                                schema_info: Dict[str, Any]) -> tuple:
+        """Resolve (actual_type, key_attr) for an entity_list item. Cached.
+
+        Items of one answer mostly share a handful of declared subtypes, so
+        the subtype match and key lookups run once per distinct value.
+        """
+        cache_key = (target_entity_type, declared_type)
+        cached = self._subtype_resolution_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        actual_type = target_entity_type
         if schema_info.get("is_abstract"):
             # Use "type" field from item to determine subtype
-            declared_type = item.get("type", "")
             subtypes = schema_info.get("subtypes", {})
             if declared_type in subtypes:
                 actual_type = declared_type
@@ -1911,15 +2284,53 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
         if not key_attr:
             # Fall back to parent type key
             key_attr = self.get_key_attr_for_entity(target_entity_type)
-        if not key_attr:
-            logger.error(f"No @key found for {actual_type}")
-            return
 
-        # Generate entity ID
-        entity_id = f"{provision_id}_{actual_type}_{index}"
+        result = (actual_type, key_attr)
+        if key_attr:
+            self._subtype_resolution_cache[cache_key] = result
+        return result
+
+    # {(target_entity_type, actual_type, item_keys): ((field, value_type, prefix), ...)}
+    _item_render_plan_cache: Dict[tuple, tuple] = {}
+    _ITEM_RENDER_PLAN_CACHE_MAX = 1024
+
+    def _get_item_render_plan(self, target_entity_type: str, actual_type: str,
+                              schema_info: Dict[str, Any], item_keys: tuple) -> tuple:
+        """Stored fields for one item shape (its key tuple, in order). Cached.
+
+        Items of one entity type repeat a few key sets, so the per-field
+        type lookup and non-extracted filtering run once per shape.
+        """
+        cache_key = (target_entity_type, actual_type, item_keys)
+        plan = self._item_render_plan_cache.get(cache_key)
+        if plan is not None:
+            return plan
+
+        field_types = self._get_entity_field_types(target_entity_type, actual_type, schema_info)
+        plan = tuple(
+            (field_name, field_types[field_name], f"has {field_name} ")
+            for field_name in item_keys
+            if field_name in field_types
+        )
+        if field_types and len(self._item_render_plan_cache) < self._ITEM_RENDER_PLAN_CACHE_MAX:
+            self._item_render_plan_cache[cache_key] = plan
+        return plan
+
+    # {(target_entity_type, actual_type): {field_name: value_type}}
+    _entity_field_types_cache: Dict[tuple, Dict[str, str]] = {}
 
-        # Build attribute list
-        attrs = [f'has {key_attr} "{entity_id}"']
+    def _get_entity_field_types(self, target_entity_type: str, actual_type: str,
+                                schema_info: Dict[str, Any]) -> Dict[str, str]:
+        """Extractable fields of actual_type with their schema value types. Cached.
+
+        Resolves the allowed-field set (subtype + parent common fields +
+        provenance) and the value-type lookup once per type, so storing each
+        entity is a single dict probe per item field.
+        """
+        cache_key = (target_entity_type, actual_type)
+        cached = self._entity_field_types_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         # Get allowed fields from schema
         if schema_info.get("is_abstract") and actual_type in schema_info.get("subtypes", {}):
@@ -1932,57 +2343,14 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
 
         # Add provenance attrs to allowed set
         allowed_fields |= self._load_provenance_attrs()
+        # Discriminator / SSoT-only fields, not extracted
+        allowed_fields -= _NON_EXTRACTED_FIELDS
 
-        # Get expected value types from schema for type coercion
         attr_types = self.get_attr_value_types(actual_type)
-        if not attr_types:
-            logger.error(f"No schema type info for {actual_type} — cannot store entity")
-            return
-        if index == 0:
-            logger.info(f"Type map for {actual_type}: {len(attr_types)} attrs — {attr_types}")
-
-        for field_name, value in item.items():
-            if field_name in ("type", "capacity_category"):
-                continue  # Discriminator / SSoT-only fields, not extracted
-            if field_name not in allowed_fields:
-                continue
-            if value is None:
-                continue
-
-            formatted = self._format_tql_value(value, attr_types.get(field_name))
-            if formatted is not None:
-                attrs.append(f'has {field_name} {formatted}')
-
-        logger.info(f"Entity {actual_type}[{index}] attrs sample: {attrs[:4]}")
-
-        attrs_str = ",\n                ".join(attrs)
-
-        # Build match clause (parent_match is pre-formatted by _get_relation_config)
-        parent_match = config["parent_match"]
-        roles = config["roles"]
-        parent_var = config.get("parent_var", "$prov")
-
-        query = f'''
-            match
-                {parent_match}
-            insert
-                $entity isa {actual_type},
-                {attrs_str};
-                ({roles[0]}: {parent_var}, {roles[1]}: $entity) isa {target_relation_type};
-        '''
-        self._execute_query(query)
-
-        # Set capacity_category from SSoT classification
-        cap_cat = self._load_capacity_classifications().get(actual_type)
-        if cap_cat:
-            try:
-                self._execute_query(f'''
-                    match $b isa {actual_type}, has {key_attr} "{entity_id}";
-                        not {{ $b has capacity_category $existing; }};
-                    insert $b has capacity_category "{cap_cat}";
-                ''')
-            except Exception:
-                pass  # Already set or type doesn't support it
+        result = {f: attr_types[f] for f in allowed_fields if f in attr_types}
+        if result:
+            self._entity_field_types_cache[cache_key] = result
+        return result
 
     def _store_flat_answer(self, provision_id: str, answer: Answer):
         """Store a scalar or multiselect answer via store_scalar_answer.
@@ -2066,6 +2434,9 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
         # Clear caches so they're reloaded after cleanup
         GraphStorage._cross_covenant_cache = None
         GraphStorage._capacity_class_cache = None
+        self._forget_provisions(
+            provision_id, investment_prov_id, f"investment_{self.deal_id}"
+        )
 
         cleanup_queries = [
             # ── Phase 1: Delete Channel 1 & 2 relations ─────────────────────
@@ -2274,6 +2645,19 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
 
         logger.info(f"Cleaned up old data for provision {provision_id}")
 
+    def _forget_provisions(self, *provision_ids: str):
+        """Drop cached IIDs and ensured/basket state for deleted or rebuilt provisions.
+
+        IID-matched writes against a deleted concept insert nothing, so any
+        path that deletes provision data must call this.
+        """
+        for provision_id in provision_ids:
+            self._provision_iids.pop(provision_id, None)
+        # Ensured keys and basket IDs also cover cross-covenant provisions
+        # touched while storing this one, so drop them wholesale
+        self._ensured.clear()
+        self._basket_id_cache.clear()
+
     @staticmethod
     def _coerce_flat_answer(value: Any, storage_value_type: Optional[str]) -> Any:
         """Coerce a FlatAnswer value to the correct Python type based on storage_value_type.
@@ -2284,14 +2668,14 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
         """
         if value is None:
             return None
-        if isinstance(value, str) and value.lower() in ("not_found", "n/a", "none", "null"):
+        if isinstance(value, str) and value.lower() in _NULL_ANSWER_STRINGS:
             return None
 
         if storage_value_type in ("boolean",):
             if isinstance(value, bool):
                 return value
             if isinstance(value, str):
-                return value.lower() in ("true", "yes", "1")
+                return value.lower() in _TRUTHY_STRINGS
             return bool(value)
 
         if storage_value_type in ("double", "number"):
@@ -2338,58 +2722,71 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
         Returns:
             The generated answer_id
         """
-        answer_id = self._gen_id("ans")
+        answer_id, query = self._build_scalar_answer_query(
+            provision_id, question_id, value,
+            source_text=source_text, source_page=source_page,
+            source_section=source_section, confidence=confidence,
+        )
+        self._execute_query(query)
+        logger.debug(f"Stored answer {answer_id}: {question_id} = {value}")
+        return answer_id
 
-        attrs = [f'has answer_id "{answer_id}"']
+    def _build_scalar_answer_query(
+        self,
+        provision_id: str,
+        question_id: str,
+        value: Any,
+        *,
+        source_text: Optional[str] = None,
+        source_page: Optional[int] = None,
+        source_section: Optional[str] = None,
+        confidence: Optional[str] = None,
+    ) -> tuple:
+        """Build the provision_has_answer insert for store_scalar_answer.
+
+        Returns (answer_id, query). Does not execute.
+        """
+        _safe_id(provision_id)
+        _safe_id(question_id)
+        answer_id = self._gen_id("ans")
 
         # Use storage_value_type from TypeDB (SSoT) for routing;
-        # fall back to isinstance checks for backwards compatibility
+        # fall back to the Python type for backwards compatibility
         svt = self._get_storage_value_type(question_id)
-        if svt == "boolean":
-            attrs.append(f'has answer_boolean {str(bool(value)).lower()}')
-        elif svt == "double":
-            attrs.append(f'has answer_double {float(value)}')
-        elif svt == "integer":
-            attrs.append(f'has answer_integer {int(value)}')
-        elif svt == "string":
-            attrs.append(f'has answer_string "{self._escape(str(value))}"')
-        elif isinstance(value, bool):
-            attrs.append(f'has answer_boolean {str(value).lower()}')
-        elif isinstance(value, int):
-            attrs.append(f'has answer_integer {value}')
-        elif isinstance(value, float):
-            attrs.append(f'has answer_double {value}')
-        elif isinstance(value, str):
-            attrs.append(f'has answer_string "{self._escape(value)}"')
-        else:
-            attrs.append(f'has answer_string "{self._escape(str(value))}"')
-
-        if source_text:
-            attrs.append(f'has source_text "{self._escape(source_text[:2000])}"')
-        if source_page is not None:
-            attrs.append(f'has source_page {source_page}')
-        if source_section:
-            attrs.append(f'has source_section "{self._escape(source_section)}"')
-        if confidence:
-            attrs.append(f'has confidence "{confidence}"')
-
-        attrs_str = ",\n                ".join(attrs)
-
-        query = f'''
-            match
-                $prov isa provision, has provision_id "{provision_id}";
-                $q isa ontology_question, has question_id "{question_id}";
-            insert
-                (provision: $prov, question: $q) isa provision_has_answer,
-                {attrs_str};
-        '''
-        self._execute_query(query)
-        logger.debug(f"Stored answer {answer_id}: {question_id} = {value}")
-        return answer_id
+        if svt not in _ANSWER_VALUE_ATTRS:
+            svt = _PY_TYPE_STORAGE_VALUE_TYPE.get(type(value), "string")
+        value_attr, render = _ANSWER_VALUE_ATTRS[svt]
+
+        attrs = [f'has answer_id "{answer_id}"', f'has {value_attr} {render(value)}']
+
+        # Introspection failure must not silently drop provenance
+        answer_attr_types = (self._get_relation_attr_types("provision_has_answer")
+                             or _ANSWER_PROVENANCE_FALLBACK_TYPES)
+        attrs.extend(self._render_attrs({
+            "source_text": source_text,
+            "source_page": source_page,
+            "source_section": source_section,
+            "confidence": confidence,
+        }, answer_attr_types))
+
+        attrs_str = ", ".join(attrs)
+
+        prov_iid = self._get_provision_iid(provision_id)
+        q_iid = self._load_question_iids().get(question_id)
+        prov_match = (f"$prov iid {prov_iid};" if prov_iid else
+                      f'$prov isa provision, has provision_id "{provision_id}";')
+        q_match = (f"$q iid {q_iid};" if q_iid else
+                   f'$q isa ontology_question, has question_id "{question_id}";')
+
+        # Single-line query: this runs once per answer, so skip the indentation
+        # padding (the driver takes str only — no pre-encoded bytes)
+        query = (f"match {prov_match} {q_match} "
+                 f"insert (provision: $prov, question: $q) isa provision_has_answer, {attrs_str};")
+        return answer_id, query
 
     # ═══════════════════════════════════════════════════════════════════════════
     # LEGACY ENTITY STORE METHODS — DELETED (Phase 2d-ii)
-    # All entity storage now goes through _store_entity_list() / _store_single_entity()
+    # All entity storage now goes through _store_entity_list() / _build_single_entity_insert()
     # via schema introspection. Old methods:
     #   _store_builder_basket_v4, _store_builder_source_v4, _store_ratio_basket_v4,
     #   _store_general_rp_basket_v4, _store_management_basket_v4, _store_tax_basket_v4,
@@ -2407,18 +2804,64 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
 
     # Legacy MFN entity storage methods removed in Prompt 2.
     # MFN entities now flow through unified entity_list pipeline:
-    # build_entity_list_prompt → _store_entity_list → _store_single_entity
+    # build_entity_list_prompt → _store_entity_list → _build_single_entity_insert
 
     # ═══════════════════════════════════════════════════════════════════════════
     # UTILITIES
     # ═══════════════════════════════════════════════════════════════════════════
 
+    def _load_question_iids(self) -> Dict[str, str]:
+        """Load {question_id: iid} for all ontology questions in one read."""
+        if self._question_iids is not None:
+            return self._question_iids
+
+        result = {}
+        tx = self.driver.transaction(self.db_name, TransactionType.READ)
+        try:
+            query = "match $q isa ontology_question, has question_id $qid; select $q, $qid;"
+            for row in tx.query(query).resolve().as_concept_rows():
+                qid = row.get("qid").as_attribute().get_value()
+                result[qid] = row.get("q").get_iid()
+        except Exception as e:
+            logger.warning(f"Failed to prefetch question IIDs: {e}")
+        finally:
+            tx.close()
+
+        self._question_iids = result
+        return result
+
+    def _get_provision_iid(self, provision_id: str) -> Optional[str]:
+        """IID of a provision, cached once found (misses are not cached)."""
+        iid = self._provision_iids.get(provision_id)
+        if iid:
+            return iid
+
+        tx = self.driver.transaction(self.db_name, TransactionType.READ)
+        try:
+            query = f'match $p isa provision, has provision_id "{provision_id}"; select $p;'
+            for row in tx.query(query).resolve().as_concept_rows():
+                iid = row.get("p").get_iid()
+                self._provision_iids[provision_id] = iid
+                break
+        except Exception as e:
+            logger.debug(f"Could not fetch IID for provision {provision_id}: {e}")
+        finally:
+            tx.close()
+        return iid
+
     def _gen_id(self, prefix: str) -> str:
-        """Generate a unique ID with prefix."""
-        return f"{prefix}_{self.deal_id}_{uuid.uuid4().hex[:8]}"
+        """Generate a unique ID with prefix.
+
+        Suffix = 32-bit random salt drawn once per instance + a hex counter:
+        unique within the instance by construction, across instances by salt.
+        """
+        return f"{prefix}_{self.deal_id}_{self._id_salt}{next(self._id_counter):x}"
 
     def _execute_query(self, query: str, tx_type: TransactionType = TransactionType.WRITE) -> Any:
-        """Execute a TypeQL query."""
+        """Execute a TypeQL query. Write queries are queued while batching."""
+        if self._pending is not None and tx_type == TransactionType.WRITE:
+            self._pending.append((self._batch_label, query, None))
+            return None
         tx = self.driver.transaction(self.db_name, tx_type)
         try:
             result = tx.query(query).resolve()
@@ -2431,16 +2874,141 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
             tx.close()
             raise
 
-    def _link_exemption_to_provision(self, provision_id: str, exemption_id: str):
-        """Link sweep exemption to provision."""
-        query = f'''
-            match
-                $prov isa provision, has provision_id "{provision_id}";
-                $ex isa sweep_exemption, has exemption_id "{exemption_id}";
-            insert
-                (provision: $prov, exemption: $ex) isa provision_has_sweep_exemption;
-        '''
-        self._execute_query(query)
+    # ───────────────────────────────────────────────────────────────────────
+    # WRITE BATCHING — queue _execute_query writes, commit in chunks
+    # ───────────────────────────────────────────────────────────────────────
+
+    _BATCH_CHUNK_SIZE = 200
+
+    def begin_batch(self):
+        """Start queueing write queries instead of committing each one."""
+        if self._pending is None:
+            self._pending = []
+
+    def end_batch(self) -> Dict[str, List[str]]:
+        """Flush queued writes and stop batching.
+
+        Returns {label: [error, ...]} for every write that failed since
+        begin_batch, including those from intermediate _flush_batch calls,
+        keyed by the _batch_label in effect when the write was queued.
+        """
+        self._flush_batch()
+        failures: Dict[str, List[str]] = {}
+        for label, msg in self._batch_errors:
+            failures.setdefault(label, []).append(msg)
+        self._batch_errors = []
+        self._pending = None
+        self._batch_label = ""
+        return failures
+
+    def _flush_batch(self) -> List[str]:
+        """Commit queued writes in chunks of _BATCH_CHUNK_SIZE statements.
+
+        Call before any read that depends on queued writes. If a chunk fails,
+        it is rolled back and replayed one statement per transaction so a
+        single bad query only loses itself. Errors are returned and also
+        collected for end_batch.
+        """
+        pending = self._pending or []
+        if self._pending is not None:
+            self._pending = []
+        errors = []
+        size = self._BATCH_CHUNK_SIZE
+        for start in range(0, len(pending), size):
+            chunk = pending[start:start + size]
+            try:
+                self._execute_queries([q for _, q, _ in chunk])
+            except Exception as e:
+                logger.warning(f"Batch of {len(chunk)} writes failed ({e}) — replaying individually")
+                for label, query, fallback in chunk:
+                    for msg in self._replay_write(label, query, fallback):
+                        errors.append(msg)
+                        self._batch_errors.append((label, msg))
+        if pending:
+            logger.info(f"Flushed {len(pending)} batched writes ({len(errors)} failed)")
+        return errors
+
+    def _replay_write(self, label: str, query: str,
+                      fallback: Optional[List[str]]) -> List[str]:
+        """Run one write on its own; if it fails, run its fallback queries one by one."""
+        try:
+            self._execute_queries([query])
+            return []
+        except Exception as e:
+            if not fallback:
+                return [f"{label or 'write'}: {str(e)[:100]}"]
+        errors = []
+        for q in fallback:
+            try:
+                self._execute_queries([q])
+            except Exception as e:
+                errors.append(f"{label or 'write'}: {str(e)[:100]}")
+        return errors
+
+    def _execute_with_fallback(self, query: str, fallback: List[str]) -> List[str]:
+        """Execute a combined write; if it fails, execute the fallback queries individually.
+
+        While batching, the pair is queued and the fallback is applied on replay.
+        """
+        if self._pending is not None:
+            self._pending.append((self._batch_label, query, fallback))
+            return []
+        return self._replay_write("", query, fallback)
+
+    # Max unresolved query promises per transaction before waiting on the oldest
+    _PIPELINE_DEPTH = 64
+
+    def _execute_queries(self, queries: List[str]) -> None:
+        """Execute several write queries in one transaction (one commit).
+
+        Queries are pipelined: up to _PIPELINE_DEPTH are sent before waiting
+        on the oldest, so building/sending overlaps server round trips. The
+        server runs them in submission order, so later statements still see
+        earlier ones' writes (dependent entity → relation inserts are safe).
+        """
+        tx = self.driver.transaction(self.db_name, TransactionType.WRITE)
+        try:
+            in_flight = deque()
+            for query in queries:
+                in_flight.append(tx.query(query))
+                if len(in_flight) >= self._PIPELINE_DEPTH:
+                    in_flight.popleft().resolve()
+            while in_flight:
+                in_flight.popleft().resolve()
+            tx.commit()
+        except Exception:
+            if tx.is_open():
+                tx.close()
+            raise
+
+    def _capacity_category_attr(self, entity_type: str,
+                                attr_types: Dict[str, str]) -> Optional[str]:
+        """`has capacity_category "..."` clause from SSoT classification, if owned."""
+        if "capacity_category" not in attr_types:
+            return None
+        cap_cat = self._load_capacity_classifications().get(entity_type)
+        if not cap_cat:
+            return None
+        return f'has capacity_category "{self._escape(cap_cat)}"'
+
+    def _render_attrs(self, values: Dict[str, Any], attr_types: Dict[str, str]) -> List[str]:
+        """Render {attr_name: value} as `has attr literal` clauses.
+
+        Value types come from the schema (attr_types), so the caller only names
+        the attributes. Skips None/empty values and attrs the owner type does
+        not own.
+        """
+        clauses = []
+        append = clauses.append
+        format_value = self._format_tql_value
+        type_of = attr_types.get
+        for attr_name, value in values.items():
+            if value is None or value == "":
+                continue
+            tql_value = format_value(value, type_of(attr_name))
+            if tql_value is not None:
+                append(f"has {attr_name} {tql_value}")
+        return clauses
 
     def _format_tql_value(self, value, schema_type: Optional[str] = None) -> Optional[str]:
         """Format a Python value as a TypeQL literal, coercing to match schema type.
@@ -2457,13 +3025,13 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
             if st == "string":
                 # Coerce any type to string
                 if isinstance(value, bool):
-                    return f'"{str(value).lower()}"'
-                return f'"{self._escape(str(value)[:2000])}"'
+                    return f'"{_BOOL_TQL[value]}"'
+                return f'"{self._escape_text(value)}"'
             elif st == "boolean":
                 if isinstance(value, str):
-                    return value.lower() in ("true", "yes", "1") and "true" or "false"
-                return str(bool(value)).lower()
-            elif st in ("double", "long"):
+                    return _BOOL_TQL[value.lower() in _TRUTHY_STRINGS]
+                return _BOOL_TQL[bool(value)]
+            elif st in ("double", "long", "integer"):
                 if isinstance(value, bool):
                     return str(int(value))
                 if isinstance(value, str):
@@ -2478,8 +3046,13 @@ Return ONLY the JSON object with {{"answers": [...]}}. No markdown, no explanati
         # No schema type — skip attribute (don't guess)
         return None
 
+    def _escape_text(self, value) -> str:
+        """Clamp to _MAX_TEXT_LEN, then escape. Short clean text passes through uncopied."""
+        text = value if isinstance(value, str) else str(value)
+        if len(text) > _MAX_TEXT_LEN:
+            text = text[:_MAX_TEXT_LEN]
+        return self._escape(text)
+
     def _escape(self, text: str) -> str:
         """Escape text for TypeQL string."""
-        if not text:
-            return ""
-        return text.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n').replace('\r', '')
+        return escape_typeql(text)
@@ -194,6 +194,60 @@ fetch {{
 '''
 
 
+def _fetch_provision_entities(
+    tx, provision_type: str, provision_id: str
+) -> Tuple[List[dict], str, str]:
+    """Run the provision-attribute + polymorphic entity fetch in an open READ tx.
+
+    Returns (docs, prov_header, query_used). Shared by get_provision_entities
+    and the cross-covenant walk, which reuses its lookup transaction.
+    """
+    # ── Provision-level attributes (SSoT: reads whatever the provision has) ──
+    prov_header = ""
+    try:
+        prov_attr_query = (
+            f'match $p isa {provision_type}, has provision_id "{provision_id}"; '
+            f'$p has $attr_type $attr; '
+            f'let $atn = label($attr_type); '
+            f'select $atn, $attr;'
+        )
+        prov_rows = list(tx.query(prov_attr_query).resolve().as_concept_rows())
+        prov_attrs = {}
+        for row in prov_rows:
+            attr_type = row.get("atn").as_value().get()
+            attr_val = row.get("attr").as_attribute().get_value()
+            if attr_type != "provision_id":
+                prov_attrs[attr_type] = attr_val
+        if prov_attrs:
+            lines = [f"## PROVISION: {provision_type} ({provision_id})"]
+            for k, v in sorted(prov_attrs.items()):
+                lines.append(f"- **{k}**: {v}")
+            prov_header = "\n".join(lines) + "\n\n"
+    except Exception as e:
+        logger.warning(f"Provision attribute query failed: {e}")
+
+    # SSoT: introspect schema to decide if children subquery is needed
+    if _provision_has_child_relations(provision_type):
+        query = _FETCH_QUERY.format(prov_type=provision_type, pid=provision_id)
+    else:
+        query = _FETCH_QUERY_SIMPLE.format(prov_type=provision_type, pid=provision_id)
+    try:
+        answer = tx.query(query).resolve()
+        docs = list(answer.as_concept_documents())
+    except Exception as e:
+        logger.warning(f"Full fetch query failed for {provision_type}, falling back to simple: {e}")
+        docs = []
+
+    # Fallback: if full query returned 0 docs, try simple query
+    if not docs and _provision_has_child_relations(provision_type):
+        logger.info(f"Retrying {provision_type} with simple fetch query")
+        query = _FETCH_QUERY_SIMPLE.format(prov_type=provision_type, pid=provision_id)
+        answer = tx.query(query).resolve()
+        docs = list(answer.as_concept_documents())
+
+    return docs, prov_header, query
+
+
 # ═════════════════════════════════════════════════════════════════════════════
 # PUBLIC API
 # ═════════════════════════════════════════════════════════════════════════════
@@ -223,48 +277,9 @@ def get_provision_entities(
             typedb_client.database, TransactionType.READ
         )
         try:
-            # ── Provision-level attributes (SSoT: reads whatever the provision has) ──
-            prov_header = ""
-            try:
-                prov_attr_query = (
-                    f'match $p isa {provision_type}, has provision_id "{provision_id}"; '
-                    f'$p has $attr_type $attr; '
-                    f'let $atn = label($attr_type); '
-                    f'select $atn, $attr;'
-                )
-                prov_rows = list(tx.query(prov_attr_query).resolve().as_concept_rows())
-                prov_attrs = {}
-                for row in prov_rows:
-                    attr_type = row.get("atn").as_value().get()
-                    attr_val = row.get("attr").as_attribute().get_value()
-                    if attr_type != "provision_id":
-                        prov_attrs[attr_type] = attr_val
-                if prov_attrs:
-                    lines = [f"## PROVISION: {provision_type} ({provision_id})"]
-                    for k, v in sorted(prov_attrs.items()):
-                        lines.append(f"- **{k}**: {v}")
-                    prov_header = "\n".join(lines) + "\n\n"
-            except Exception as e:
-                logger.warning(f"Provision attribute query failed: {e}")
-
-            # SSoT: introspect schema to decide if children subquery is needed
-            if _provision_has_child_relations(provision_type):
-                query = _FETCH_QUERY.format(prov_type=provision_type, pid=provision_id)
-            else:
-                query = _FETCH_QUERY_SIMPLE.format(prov_type=provision_type, pid=provision_id)
-            try:
-                answer = tx.query(query).resolve()
-                docs = list(answer.as_concept_documents())
-            except Exception as e:
-                logger.warning(f"Full fetch query failed for {provision_type}, falling back to simple: {e}")
-                docs = []
-
-            # Fallback: if full query returned 0 docs, try simple query
-            if not docs and _provision_has_child_relations(provision_type):
-                logger.info(f"Retrying {provision_type} with simple fetch query")
-                query = _FETCH_QUERY_SIMPLE.format(prov_type=provision_type, pid=provision_id)
-                answer = tx.query(query).resolve()
-                docs = list(answer.as_concept_documents())
+            docs, prov_header, query = _fetch_provision_entities(
+                tx, provision_type, provision_id
+            )
         finally:
             tx.close()
         duration_ms = (time.time() - start) * 1000
@@ -314,7 +329,8 @@ def get_cross_covenant_entities(
     (source_provision: mfn, target_provision: rp), so this walks MFN→RP.
     RP questions should NOT call this — they would find no outgoing edges.
 
-    Reuses get_provision_entities() for the actual entity fetch (SSoT).
+    Reuses _fetch_provision_entities() for the actual entity fetch (SSoT),
+    inside the lookup's read transaction.
     """
     if not typedb_client.driver:
         return [], ""
@@ -341,6 +357,26 @@ def get_cross_covenant_entities(
                 select $target_pid, $ttype;
             """
             result = list(tx.query(query).resolve().as_concept_rows())
+
+            # For each linked provision, fetch its entities in this same
+            # transaction (no per-target transaction open/close)
+            all_cross_docs = []
+            for row in result:
+                target_pid = row.get("target_pid").as_attribute().get_value()
+                target_type = row.get("ttype").as_value().get()
+
+                try:
+                    target_docs, _, _ = _fetch_provision_entities(
+                        tx, target_type, target_pid
+                    )
+                except Exception as e:
+                    logger.error(f"Polymorphic entity fetch failed: {e}")
+                    continue
+
+                # Mark each entity as cross-covenant sourced
+                for doc in target_docs:
+                    doc["source"] = "cross_reference"
+                all_cross_docs.extend(target_docs)
         finally:
             tx.close()
 
@@ -354,24 +390,6 @@ def get_cross_covenant_entities(
                 )
             return [], ""
 
-        # For each linked provision, fetch its entities
-        all_cross_docs = []
-        for row in result:
-            target_pid = row.get("target_pid").as_attribute().get_value()
-            target_type = row.get("ttype").as_value().get()
-
-            # Extract deal_id from provision_id (format: "{deal_id}_{suffix}")
-            target_deal_id = target_pid.rsplit("_", 1)[0]
-
-            target_docs, _ = get_provision_entities(
-                target_deal_id, target_type, trace=None
-            )
-
-            # Mark each entity as cross-covenant sourced
-            for doc in target_docs:
-                doc["source"] = "cross_reference"
-            all_cross_docs.extend(target_docs)
-
         duration_ms = (time.time() - start) * 1000
 
         if trace:
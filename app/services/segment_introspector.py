@@ -2,10 +2,30 @@
 
 from typing import List, Dict, Optional
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
 _segment_cache: Optional[List[Dict]] = None
+# Serializes cold loads so concurrent first callers issue one TypeDB query
+_segment_lock = threading.Lock()
+# {"<covenant>_universe_field": {segment_type_id: section_name}}, built in the
+# same pass that loads _segment_cache
+_field_maps: Dict[str, Dict[str, str]] = {}
+
+_UNIVERSE_FIELDS = ("rp_universe_field", "mfn_universe_field", "di_universe_field")
+
+
+def _build_field_maps(segments: List[Dict]) -> Dict[str, Dict[str, str]]:
+    """One pass over segments → segment_type_id mapping per universe field."""
+    maps: Dict[str, Dict[str, str]] = {f: {} for f in _UNIVERSE_FIELDS}
+    for s in segments:
+        sid = s["segment_type_id"]
+        for f in _UNIVERSE_FIELDS:
+            section = s.get(f)
+            if section:
+                maps[f][sid] = section
+    return maps
 
 
 def get_segment_types() -> List[Dict]:
@@ -16,10 +36,30 @@ def get_segment_types() -> List[Dict]:
     Returns list of dicts with: segment_type_id, name, find_description,
     display_order, rp_universe_field (nullable).
     """
-    global _segment_cache
     if _segment_cache is not None:
         return _segment_cache
 
+    # Double-checked: callers that waited on the lock reuse the winner's load
+    with _segment_lock:
+        if _segment_cache is not None:
+            return _segment_cache
+        return _load_segment_types()
+
+
+def prewarm_segment_types() -> None:
+    """Load segment types on a daemon thread so the first request finds them cached.
+
+    Called at startup once TypeDB is connected; the double-checked lock makes
+    a request that races the warm-up wait for it instead of querying again.
+    """
+    threading.Thread(
+        target=get_segment_types, name="segment-types-prewarm", daemon=True
+    ).start()
+
+
+def _load_segment_types() -> List[Dict]:
+    """Query TypeDB and populate _segment_cache. Caller holds _segment_lock."""
+    global _segment_cache, _field_maps
     try:
         from app.services.typedb_client import typedb_client
         from app.config import settings
@@ -73,6 +113,7 @@ def get_segment_types() -> List[Dict]:
                 })
 
             segments.sort(key=lambda x: x["display_order"])
+            _field_maps = _build_field_maps(segments)
             _segment_cache = segments
             logger.info(f"Loaded {len(segments)} segment types from TypeDB")
             validate_segment_references()
@@ -89,12 +130,7 @@ def get_rp_segment_mapping() -> Dict[str, str]:
     Get segment_type_id -> rp_universe_field mapping.
     Only returns segments that map to RPUniverse fields.
     """
-    segments = get_segment_types()
-    return {
-        s["segment_type_id"]: s["rp_universe_field"]
-        for s in segments
-        if s.get("rp_universe_field")
-    }
+    return _get_field_map("rp_universe_field")
 
 
 def get_mfn_segment_mapping() -> Dict[str, str]:
@@ -103,11 +139,24 @@ def get_mfn_segment_mapping() -> Dict[str, str]:
     Only returns segments that map to MFN universe fields.
     SSoT: loaded from TypeDB mfn_universe_field attribute.
     """
+    return _get_field_map("mfn_universe_field")
+
+
+def _get_field_map(field_name: str) -> Dict[str, str]:
+    """Cached segment_type_id -> field_name mapping (built with the segment cache).
+
+    The returned dict is shared across callers — treat it as read-only.
+    """
     segments = get_segment_types()
+    if _segment_cache is not None:
+        cached = _field_maps.get(field_name)
+        if cached is not None:
+            return cached
+    # Field not precomputed (new covenant type) or load failed — derive directly
     return {
-        s["segment_type_id"]: s["mfn_universe_field"]
+        s["segment_type_id"]: s[field_name]
         for s in segments
-        if s.get("mfn_universe_field")
+        if s.get(field_name)
     }
 
 
@@ -124,13 +173,7 @@ def get_segment_mapping_for_covenant(covenant_type: str) -> Dict[str, str]:
         Dict mapping segment_type_id to the section name for that covenant's universe
     """
     field_name = f"{covenant_type.lower()}_universe_field"
-    segments = get_segment_types()
-
-    mapping = {
-        s["segment_type_id"]: s[field_name]
-        for s in segments
-        if s.get(field_name)
-    }
+    mapping = _get_field_map(field_name)
 
     if not mapping:
         logger.warning(f"No segment mapping found for covenant type {covenant_type} (field: {field_name})")
@@ -172,6 +215,7 @@ def validate_segment_references():
 
 
 def clear_cache():
-    """Clear the segment cache (for testing)."""
-    global _segment_cache
+    """Clear the segment cache and derived mappings (for testing)."""
+    global _segment_cache, _field_maps
     _segment_cache = None
+    _field_maps = {}
@@ -0,0 +1,93 @@
+"""
+Extraction status store — deal_id → latest ExtractionStatus.
+
+Process-local, which matches the single uvicorn worker we deploy. Callers
+use it like a dict, so a shared backend can replace it without touching
+the extraction code.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from app.schemas.models import ExtractionStatus
+
+# Statuses that won't change again; only these are ever evicted
+_FINISHED_STATUSES = frozenset({"complete", "error"})
+
+
+class ExtractionStatusStore:
+    """Latest extraction status per deal, with bounded retention.
+
+    Finished entries expire after ttl_seconds, and at most max_finished are
+    kept (oldest dropped first). In-flight entries are never evicted.
+    """
+
+    def __init__(self, ttl_seconds: int = 86400, max_finished: int = 1000):
+        self._ttl = ttl_seconds
+        self._max_finished = max_finished
+        # deal_id → (updated_at, status), oldest update first
+        self._entries: "OrderedDict[str, Tuple[float, ExtractionStatus]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __setitem__(self, deal_id: str, status: ExtractionStatus) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._entries.pop(deal_id, None)
+            self._entries[deal_id] = (now, status)
+            self._prune(now)
+
+    def get(self, deal_id: str) -> Optional[ExtractionStatus]:
+        with self._lock:
+            entry = self._entries.get(deal_id)
+            if entry is None:
+                return None
+            if self._expired(entry, time.monotonic()):
+                del self._entries[deal_id]
+                return None
+            return entry[1]
+
+    def pop(self, deal_id: str, default=None) -> Optional[ExtractionStatus]:
+        """Remove and return a deal's status in one step; default if absent/expired."""
+        with self._lock:
+            entry = self._entries.pop(deal_id, None)
+        if entry is None or self._expired(entry, time.monotonic()):
+            return default
+        return entry[1]
+
+    def __getitem__(self, deal_id: str) -> ExtractionStatus:
+        status = self.get(deal_id)
+        if status is None:
+            raise KeyError(deal_id)
+        return status
+
+    def __contains__(self, deal_id: str) -> bool:
+        return self.get(deal_id) is not None
+
+    def __delitem__(self, deal_id: str) -> None:
+        with self._lock:
+            del self._entries[deal_id]
+
+    def _expired(self, entry: Tuple[float, ExtractionStatus], now: float) -> bool:
+        updated_at, status = entry
+        return status.status in _FINISHED_STATUSES and now - updated_at > self._ttl
+
+    def _prune(self, now: float) -> None:
+        """Drop expired finished entries, then the oldest beyond the cap."""
+        finished = [
+            (deal_id, updated_at)
+            for deal_id, (updated_at, status) in self._entries.items()
+            if status.status in _FINISHED_STATUSES
+        ]
+        excess = len(finished) - self._max_finished
+        for deal_id, updated_at in finished:
+            if excess > 0:
+                excess -= 1
+            elif now - updated_at <= self._ttl:
+                # Entries are in update order, so the rest are newer
+                break
+            del self._entries[deal_id]
+
+
+# Global store instance
+extraction_status_store = ExtractionStatusStore()
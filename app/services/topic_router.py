@@ -10,38 +10,50 @@ relation, does the Q&A layer automatically know about it without code changes?"
 Answer: YES.
 """
 import logging
+import operator
 import re
+import sys
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set
+from itertools import chain
+from typing import AbstractSet, Dict, List, Optional, Sequence, Set, Tuple
 
 from app.services.typedb_client import TypeDBClient, get_typedb_client
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class CategoryMetadata:
     """Runtime metadata for a single ontology category, loaded from TypeDB."""
     category_id: str
     name: str
     description: str
     covenant_type: str  # "RP" or "MFN"
-    question_ids: List[str] = field(default_factory=list)
-    target_fields: List[str] = field(default_factory=list)
-    target_concept_types: List[str] = field(default_factory=list)
+    # Lists while loading, frozen to tuples once the load completes
+    question_ids: Sequence[str] = field(default_factory=list)
+    target_fields: Sequence[str] = field(default_factory=list)
+    target_concept_types: Sequence[str] = field(default_factory=list)
     synthesis_guidance: str = ""
-    # Derived at load time from name + description
-    keywords: Set[str] = field(default_factory=set)
+    # Derived at load time: lowercased name for phrase matching, and
+    # keywords from name + description (frozenset once loaded)
+    name_lower: str = ""
+    keywords: AbstractSet[str] = field(default_factory=frozenset)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TopicRouteResult:
-    """Result of routing a user question to TypeDB categories."""
-    matched_categories: List[CategoryMetadata]
+    """Result of routing a user question to TypeDB categories.
+
+    Immutable: route() memoizes results and hands the same instance to
+    every caller asking the same question.
+    """
+    matched_categories: Tuple[CategoryMetadata, ...]
     covenant_type: str  # "mfn", "rp", or "both"
-    question_ids: List[str]  # All question IDs across matched categories
-    all_target_fields: List[str]  # All target field names across matches
+    question_ids: Tuple[str, ...]  # All question IDs across matched categories
+    all_target_fields: Tuple[str, ...]  # All target field names across matches
     is_specific: bool  # True if matched <= 3 categories (targeted query feasible)
 
 
@@ -62,11 +74,26 @@ _STOPWORDS = frozenset({
 # Minimum word length to include in keyword matching
 _MIN_KEYWORD_LEN = 3
 
+_TOKEN_RE = re.compile(r'[a-z][a-z0-9]+')
+
+# Max routed questions memoized per TopicRouter
+_ROUTE_CACHE_MAX = 512
+
+
+def _tokenize_lower(text_lower: str) -> Set[str]:
+    """Tokenize already-lowercased text, excluding stopwords and short words."""
+    # Locals, so the per-word filter skips global lookups
+    min_len = _MIN_KEYWORD_LEN
+    stopwords = _STOPWORDS
+    return {
+        w for w in _TOKEN_RE.findall(text_lower)
+        if len(w) >= min_len and w not in stopwords
+    }
+
 
 def _tokenize(text: str) -> Set[str]:
     """Tokenize text into lowercase words, excluding stopwords and short words."""
-    words = re.findall(r'[a-z][a-z0-9]+', text.lower())
-    return {w for w in words if w not in _STOPWORDS and len(w) >= _MIN_KEYWORD_LEN}
+    return _tokenize_lower(text.lower())
 
 
 class TopicRouter:
@@ -85,32 +112,104 @@ class TopicRouter:
         self._cache: Optional[Dict[str, CategoryMetadata]] = None
         self._cache_time: float = 0
         self._ttl = cache_ttl_seconds
+        # Rebuilt with the metadata cache: keyword → category_ids (token
+        # overlap), the flat (keyword, category_ids) tuple (substring scan),
+        # and (name_lower, category_id, category) in load order (name phrases)
+        self._keyword_index: Dict[str, Tuple[str, ...]] = {}
+        self._flat_keywords: Tuple[Tuple[str, Tuple[str, ...]], ...] = ()
+        self._cat_names_lower: Tuple[Tuple[str, str, CategoryMetadata], ...] = ()
+        # (normalized question, cache_time) → result; cache_time in the key
+        # retires entries whenever the metadata is reloaded
+        self._route_cache: "OrderedDict[tuple, TopicRouteResult]" = OrderedDict()
+        self._route_cache_lock = threading.Lock()
+        # Held by whichever caller is reloading metadata (singleflight)
+        self._refresh_lock = threading.Lock()
+        # Bumped by invalidate_cache(); a reload that started under an older
+        # generation is discarded instead of reinstalling pre-invalidation data
+        self._cache_generation = 0
+        self._generation_lock = threading.Lock()
 
     # ── Cache management ──────────────────────────────────────────────
 
     def _get_cached_metadata(self) -> Dict[str, CategoryMetadata]:
-        """Return cached category metadata, refreshing if TTL expired."""
+        """Return cached category metadata, refreshing if TTL expired.
+
+        Only one caller reloads at a time. Once a cache exists, an expired
+        TTL triggers a background reload and callers keep the stale cache
+        meanwhile; only the very first load blocks.
+        """
+        cache = self._cache
+        if cache is not None:
+            if (time.time() - self._cache_time) > self._ttl:
+                # Stale cache is better than waiting on TypeDB
+                if self._refresh_lock.acquire(blocking=False):
+                    threading.Thread(
+                        target=self._refresh_in_background,
+                        name="topic-router-refresh",
+                        daemon=True,
+                    ).start()
+            return cache
+
+        with self._refresh_lock:
+            # Re-check: another thread may have loaded while we waited. Loop
+            # because an invalidation during the load discards its result.
+            while self._cache is None:
+                try:
+                    self._refresh()
+                except Exception as e:
+                    logger.error("TopicRouter cache refresh failed: %s", e)
+                    raise
+            return self._cache
+
+    def _refresh_in_background(self) -> None:
+        """Reload metadata; the caller already holds _refresh_lock."""
+        try:
+            self._refresh()
+        except Exception as e:
+            logger.error("TopicRouter cache refresh failed: %s", e)
+        finally:
+            self._refresh_lock.release()
+
+    def _refresh(self) -> None:
+        """Load metadata and swap in the cache with its derived indexes.
+
+        The result is dropped if invalidate_cache() ran while loading.
+        """
+        generation = self._cache_generation
         now = time.time()
-        if self._cache is None or (now - self._cache_time) > self._ttl:
-            try:
-                self._cache = self._load_category_metadata()
-                self._cache_time = now
-                logger.info(
-                    "TopicRouter cache refreshed: %d categories loaded",
-                    len(self._cache),
-                )
-            except Exception as e:
-                logger.error("TopicRouter cache refresh failed: %s", e)
-                if self._cache is not None:
-                    # Stale cache is better than no cache
-                    return self._cache
-                raise
-        return self._cache
+        categories = self._load_category_metadata()
+        keyword_index = _build_keyword_index(categories)
+        cat_names_lower = tuple(
+            (cat.name_lower, cid, cat) for cid, cat in categories.items()
+        )
+        with self._generation_lock:
+            if generation != self._cache_generation:
+                logger.info("TopicRouter cache invalidated during refresh; discarding result")
+                return
+            self._keyword_index = keyword_index
+            self._flat_keywords = tuple(keyword_index.items())
+            self._cat_names_lower = cat_names_lower
+            # Assigned last so readers never see the new cache without its indexes
+            self._cache = categories
+            self._cache_time = now
+        logger.info(
+            "TopicRouter cache refreshed: %d categories loaded",
+            len(categories),
+        )
 
     def invalidate_cache(self) -> None:
         """Force cache refresh on next access."""
-        self._cache = None
-        self._cache_time = 0
+        # Drop pooled read snapshots so the reload sees the latest ontology
+        self._client.drain_read_pool()
+        with self._generation_lock:
+            self._cache_generation += 1
+            self._cache = None
+            self._cache_time = 0
+            self._keyword_index = {}
+            self._flat_keywords = ()
+            self._cat_names_lower = ()
+        with self._route_cache_lock:
+            self._route_cache.clear()
 
     # ── TypeDB metadata loading ───────────────────────────────────────
 
@@ -121,22 +220,55 @@ class TopicRouter:
         """
         categories: Dict[str, CategoryMetadata] = {}
 
-        with self._client.read_transaction() as tx:
-            # 1. Load all categories (covenant_type lives on questions, not categories)
-            cat_query = """
-                match
-                    $c isa ontology_category,
-                        has category_id $cid,
-                        has name $cname;
-                    try { $c has description $cdesc; };
-                    try { $c has synthesis_guidance $sg; };
-                select $cid, $cname, $cdesc, $sg;
-            """
-            cat_result = tx.query(cat_query).resolve()
-            for row in cat_result.as_concept_rows():
+        cat_query = """
+            match
+                $c isa ontology_category,
+                    has category_id $cid,
+                    has name $cname;
+                try { $c has description $cdesc; };
+                try { $c has synthesis_guidance $sg; };
+            select $cid, $cname, $cdesc, $sg;
+        """
+        q_query = """
+            match
+                (category: $cat, question: $q) isa category_has_question;
+                $cat has category_id $cid;
+                $q has question_id $qid, has covenant_type $qctype;
+            select $cid, $qid, $qctype;
+        """
+        field_query = """
+            match
+                (category: $cat, question: $q) isa category_has_question;
+                $cat has category_id $cid;
+                (question: $q) isa question_targets_field,
+                    has target_field_name $tfn;
+            select $cid, $tfn;
+        """
+        concept_query = """
+            match
+                (category: $cat, question: $q) isa category_has_question;
+                $cat has category_id $cid;
+                (question: $q) isa question_targets_concept,
+                    has target_concept_type $tct;
+            select $cid, $tct;
+        """
+
+        with self._client.pooled_read_transaction() as tx:
+            # Submit all four reads before resolving any, so the server runs
+            # them back-to-back instead of one round-trip per query.
+            cat_promise = tx.query(cat_query)
+            q_promise = tx.query(q_query)
+            field_promise = tx.query(field_query)
+            concept_promise = tx.query(concept_query)
+
+            # 1. Categories (covenant_type lives on questions, not categories)
+            for row in cat_promise.resolve().as_concept_rows():
                 cid = _safe_get_value(row, "cid")
                 if not cid:
                     continue
+                # IDs recur across categories, route results and caches;
+                # interned copies are shared and compare by identity first
+                cid = sys.intern(cid)
                 cname = _safe_get_value(row, "cname", "")
                 cdesc = _safe_get_value(row, "cdesc", "")
                 sg = _safe_get_value(row, "sg", "")
@@ -150,26 +282,25 @@ class TopicRouter:
                     description=cdesc,
                     covenant_type="RP",  # default; derived from questions below
                     synthesis_guidance=sg,
+                    name_lower=cname.lower(),
                     keywords=keywords,
                 )
 
-            # 2. Load question → category mappings WITH covenant_type from questions
-            q_query = """
-                match
-                    (category: $cat, question: $q) isa category_has_question;
-                    $cat has category_id $cid;
-                    $q has question_id $qid, has covenant_type $qctype;
-                select $cid, $qid, $qctype;
-            """
-            q_result = tx.query(q_query).resolve()
+            # Per-category (kind, value) pairs already appended, so the lists
+            # below stay unique without a dedup pass on every route()
+            seen: Dict[str, Set[tuple]] = {cid: set() for cid in categories}
+
+            # 2. Question → category mappings WITH covenant_type from questions
             # Track covenant types per category to derive category covenant_type
             cat_covenant_types: Dict[str, set] = {}
-            for row in q_result.as_concept_rows():
+            for row in q_promise.resolve().as_concept_rows():
                 cid = _safe_get_value(row, "cid")
                 qid = _safe_get_value(row, "qid")
                 qctype = _safe_get_value(row, "qctype", "RP")
                 if cid and qid and cid in categories:
-                    categories[cid].question_ids.append(qid)
+                    if ("q", qid) not in seen[cid]:
+                        seen[cid].add(("q", qid))
+                        categories[cid].question_ids.append(sys.intern(qid))
                     cat_covenant_types.setdefault(cid, set()).add(qctype)
 
             # Derive covenant_type per category from its questions' covenant_types
@@ -185,42 +316,33 @@ class TopicRouter:
                         # Mixed — keep as RP (most categories are RP)
                         categories[cid].covenant_type = "RP"
 
-            # 3. Load question → target_field mappings (Channel 1: scalar)
-            field_query = """
-                match
-                    (category: $cat, question: $q) isa category_has_question;
-                    $cat has category_id $cid;
-                    (question: $q) isa question_targets_field,
-                        has target_field_name $tfn;
-                select $cid, $tfn;
-            """
-            field_result = tx.query(field_query).resolve()
-            for row in field_result.as_concept_rows():
+            # 3. Question → target_field mappings (Channel 1: scalar)
+            for row in field_promise.resolve().as_concept_rows():
                 cid = _safe_get_value(row, "cid")
                 tfn = _safe_get_value(row, "tfn")
-                if cid and tfn and cid in categories:
-                    categories[cid].target_fields.append(tfn)
+                if cid and tfn and cid in categories and ("f", tfn) not in seen[cid]:
+                    seen[cid].add(("f", tfn))
+                    categories[cid].target_fields.append(sys.intern(tfn))
                     # Also add field name tokens as keywords for matching
                     categories[cid].keywords |= _tokenize(tfn.replace("_", " "))
 
-            # 4. Load question → target_concept_type mappings (Channel 2: multiselect)
-            concept_query = """
-                match
-                    (category: $cat, question: $q) isa category_has_question;
-                    $cat has category_id $cid;
-                    (question: $q) isa question_targets_concept,
-                        has target_concept_type $tct;
-                select $cid, $tct;
-            """
-            concept_result = tx.query(concept_query).resolve()
-            for row in concept_result.as_concept_rows():
+            # 4. Question → target_concept_type mappings (Channel 2: multiselect)
+            for row in concept_promise.resolve().as_concept_rows():
                 cid = _safe_get_value(row, "cid")
                 tct = _safe_get_value(row, "tct")
-                if cid and tct and cid in categories:
-                    categories[cid].target_concept_types.append(tct)
+                if cid and tct and cid in categories and ("c", tct) not in seen[cid]:
+                    seen[cid].add(("c", tct))
+                    categories[cid].target_concept_types.append(sys.intern(tct))
                     # Add concept type tokens as keywords too
                     categories[cid].keywords |= _tokenize(tct.replace("_", " "))
 
+        # Cached metadata is shared by every route() call — freeze it
+        for cat in categories.values():
+            cat.keywords = frozenset(cat.keywords)
+            cat.question_ids = tuple(cat.question_ids)
+            cat.target_fields = tuple(cat.target_fields)
+            cat.target_concept_types = tuple(cat.target_concept_types)
+
         logger.info(
             "TopicRouter loaded: %d categories, %d total questions, %d target fields",
             len(categories),
@@ -231,8 +353,18 @@ class TopicRouter:
 
     # ── Entity type mapping (for metadata-driven filtering) ────────────
 
+    # Shared by all TopicRouter instances (same TypeDB, same mapping); the
+    # lock makes a cold or expired load happen once, not once per caller
     _question_entity_types_cache: Optional[Dict[str, Set[str]]] = None
     _question_entity_types_time: float = 0
+    _question_entity_types_lock = threading.Lock()
+
+    @classmethod
+    def invalidate_entity_types_cache(cls) -> None:
+        """Force the shared question→entity_type map to reload on next access."""
+        with cls._question_entity_types_lock:
+            cls._question_entity_types_cache = None
+            cls._question_entity_types_time = 0
 
     def _load_question_entity_types(self) -> Dict[str, Set[str]]:
         """Load question_id → set[entity_type] mapping from TypeDB.
@@ -241,56 +373,64 @@ class TopicRouter:
         1. question_annotates_attribute → target_entity_type (scalar annotations)
         2. ontology_question with answer_type="entity_list" → target_entity_type
         """
+        cls = type(self)
         now = time.time()
-        if (self._question_entity_types_cache is not None
-                and (now - self._question_entity_types_time) < self._ttl):
-            return self._question_entity_types_cache
-
-        result: Dict[str, Set[str]] = {}
-
-        with self._client.read_transaction() as tx:
-            # Query A: annotation-based entity types
-            try:
-                q_a = """
-                    match
-                        (question: $q) isa question_annotates_attribute,
-                            has target_entity_type $et;
-                        $q has question_id $qid;
-                    select $qid, $et;
-                """
-                for row in tx.query(q_a).resolve().as_concept_rows():
-                    qid = _safe_get_value(row, "qid")
-                    et = _safe_get_value(row, "et")
-                    if qid and et:
-                        result.setdefault(qid, set()).add(et)
-            except Exception as e:
-                logger.warning(f"Annotation entity type query failed: {e}")
-
-            # Query B: entity_list question entity types
-            try:
-                q_b = """
-                    match
-                        $q isa ontology_question,
-                            has answer_type "entity_list",
-                            has question_id $qid,
-                            has target_entity_type $et;
-                    select $qid, $et;
-                """
-                for row in tx.query(q_b).resolve().as_concept_rows():
-                    qid = _safe_get_value(row, "qid")
-                    et = _safe_get_value(row, "et")
-                    if qid and et:
-                        result.setdefault(qid, set()).add(et)
-            except Exception as e:
-                logger.warning(f"Entity list entity type query failed: {e}")
-
-        self._question_entity_types_cache = result
-        self._question_entity_types_time = now
-        logger.info(
-            f"Loaded question→entity_type map: {len(result)} questions, "
-            f"{len(set().union(*result.values()) if result else set())} entity types"
-        )
-        return result
+        if (cls._question_entity_types_cache is not None
+                and (now - cls._question_entity_types_time) < self._ttl):
+            return cls._question_entity_types_cache
+
+        with cls._question_entity_types_lock:
+            # Re-check: another thread may have loaded while we waited
+            now = time.time()
+            if (cls._question_entity_types_cache is not None
+                    and (now - cls._question_entity_types_time) < self._ttl):
+                return cls._question_entity_types_cache
+
+            result: Dict[str, Set[str]] = {}
+
+            with self._client.pooled_read_transaction() as tx:
+                # Query A: annotation-based entity types
+                try:
+                    q_a = """
+                        match
+                            (question: $q) isa question_annotates_attribute,
+                                has target_entity_type $et;
+                            $q has question_id $qid;
+                        select $qid, $et;
+                    """
+                    for row in tx.query(q_a).resolve().as_concept_rows():
+                        qid = _safe_get_value(row, "qid")
+                        et = _safe_get_value(row, "et")
+                        if qid and et:
+                            result.setdefault(qid, set()).add(et)
+                except Exception as e:
+                    logger.warning(f"Annotation entity type query failed: {e}")
+
+                # Query B: entity_list question entity types
+                try:
+                    q_b = """
+                        match
+                            $q isa ontology_question,
+                                has answer_type "entity_list",
+                                has question_id $qid,
+                                has target_entity_type $et;
+                        select $qid, $et;
+                    """
+                    for row in tx.query(q_b).resolve().as_concept_rows():
+                        qid = _safe_get_value(row, "qid")
+                        et = _safe_get_value(row, "et")
+                        if qid and et:
+                            result.setdefault(qid, set()).add(et)
+                except Exception as e:
+                    logger.warning(f"Entity list entity type query failed: {e}")
+
+            cls._question_entity_types_cache = result
+            cls._question_entity_types_time = now
+            logger.info(
+                f"Loaded question→entity_type map: {len(result)} questions, "
+                f"{len(set().union(*result.values()) if result else set())} entity types"
+            )
+            return result
 
     def get_relevant_entity_types(
         self, matched_categories: List[CategoryMetadata]
@@ -321,40 +461,67 @@ class TopicRouter:
 
         Pass 1 (fast, no LLM): Token-based matching against category keywords.
         Returns a TopicRouteResult with matched categories and aggregated metadata.
+        Results are memoized per normalized question until the metadata reloads.
         """
-        metadata = self._get_cached_metadata()
-        question_tokens = _tokenize(question)
-
-        # Also check for multi-word phrases in the original question
-        q_lower = question.lower()
+        # Refreshes the metadata and its derived indexes if the TTL expired
+        self._get_cached_metadata()
+        key = (question.lower().strip(), self._cache_time)
+
+        with self._route_cache_lock:
+            cached = self._route_cache.get(key)
+            if cached is not None:
+                self._route_cache.move_to_end(key)
+                return cached
+
+        result = self._route_impl(key[0])
+
+        with self._route_cache_lock:
+            self._route_cache[key] = result
+            if len(self._route_cache) > _ROUTE_CACHE_MAX:
+                self._route_cache.popitem(last=False)
+        return result
 
-        # Score each category by keyword overlap
+    def _route_impl(self, question: str) -> TopicRouteResult:
+        """Score categories for a normalized (lowercased, stripped) question."""
+        # Already lowercased by route(); shared by tokens and phrase checks
+        q_lower = question
+        question_tokens = _tokenize_lower(q_lower)
+
+        # Check for common domain-specific aliases in the question
+        # These are derived from the category data, not hardcoded content
+        # E.g., "j.crew" matches because category name contains "j.crew" or "jcrew"
+        # Each distinct keyword is checked once, however many categories share
+        # it; keywords that are whole question tokens already score via overlap
+        scores: Dict[str, int] = {}
+        scores_get = scores.get
+        for token, cat_ids in self._flat_keywords:
+            if token in question_tokens:
+                continue
+            # Check for partial matches (e.g., "basket" in "baskets")
+            if token in q_lower:
+                for cid in cat_ids:
+                    scores[cid] = scores_get(cid, 0) + 1
+
+        # Token overlap between question and category keywords, walked from
+        # the (few) question tokens through the inverted keyword index
+        index_get = self._keyword_index.get
+        for token in question_tokens:
+            for cid in index_get(token, ()):
+                scores[cid] = scores_get(cid, 0) + 2
+
+        # Check if category name appears as a phrase in the question; this
+        # pass runs in load order so equal scores keep a stable ranking
         scored: List[tuple] = []  # (score, category)
-        for cat in metadata.values():
-            score = 0
-
-            # Token overlap between question and category keywords
-            overlap = question_tokens & cat.keywords
-            score += len(overlap) * 2
-
-            # Check if category name appears as a phrase in the question
-            cat_name_lower = cat.name.lower()
-            if cat_name_lower in q_lower:
+        scored_append = scored.append
+        for name_lower, cid, cat in self._cat_names_lower:
+            score = scores_get(cid, 0)
+            if name_lower in q_lower:
                 score += 10
-
-            # Check for common domain-specific aliases in the question
-            # These are derived from the category data, not hardcoded content
-            # E.g., "j.crew" matches because category name contains "j.crew" or "jcrew"
-            for token in cat.keywords:
-                # Check for partial matches (e.g., "builder" in "builder basket")
-                if token in q_lower:
-                    score += 1
-
             if score > 0:
-                scored.append((score, cat))
+                scored_append((score, cat))
 
         # Sort by score descending
-        scored.sort(key=lambda x: x[0], reverse=True)
+        scored.sort(key=operator.itemgetter(0), reverse=True)
 
         # Take categories with meaningful scores
         if scored:
@@ -377,26 +544,19 @@ class TopicRouter:
             )
             covenant_type = "both"
 
-        # Aggregate question IDs and target fields
-        all_qids: List[str] = []
-        all_fields: List[str] = []
-        seen_qids: Set[str] = set()
-        seen_fields: Set[str] = set()
-
-        for cat in matched:
-            for qid in cat.question_ids:
-                if qid not in seen_qids:
-                    all_qids.append(qid)
-                    seen_qids.add(qid)
-            for field in cat.target_fields:
-                if field not in seen_fields:
-                    all_fields.append(field)
-                    seen_fields.add(field)
+        # Aggregate question IDs and target fields (already unique per
+        # category; dict.fromkeys dedups across categories, keeping order)
+        all_qids = tuple(dict.fromkeys(
+            chain.from_iterable(cat.question_ids for cat in matched)
+        ))
+        all_fields = tuple(dict.fromkeys(
+            chain.from_iterable(cat.target_fields for cat in matched)
+        ))
 
         is_specific = 0 < len(matched) <= 3
 
         result = TopicRouteResult(
-            matched_categories=matched,
+            matched_categories=tuple(matched),
             covenant_type=covenant_type,
             question_ids=all_qids,
             all_target_fields=all_fields,
@@ -445,7 +605,8 @@ class TopicRouter:
         Replaces _identify_relevant_attributes() in qa_engine.py.
         """
         result = self.route(question)
-        return result.all_target_fields
+        # Copy: the memoized result is shared
+        return list(result.all_target_fields)
 
     def get_all_categories(self) -> Dict[str, CategoryMetadata]:
         """Return all cached category metadata. Useful for diagnostics."""
@@ -468,15 +629,28 @@ class TopicRouter:
         return "\n\n".join(parts)
 
 
+def _build_keyword_index(
+    categories: Dict[str, CategoryMetadata],
+) -> Dict[str, Tuple[str, ...]]:
+    """Invert category keywords into keyword → (category_id, ...)."""
+    index: Dict[str, List[str]] = {}
+    for cid, cat in categories.items():
+        for kw in cat.keywords:
+            index.setdefault(kw, []).append(cid)
+    return {kw: tuple(cids) for kw, cids in index.items()}
+
+
 def _safe_get_value(row, key: str, default=None):
-    """Safely get attribute value from a TypeDB concept row."""
-    try:
-        concept = row.get(key)
-        if concept is None:
-            return default
-        return concept.as_attribute().get_value()
-    except Exception:
+    """Get an attribute value from a TypeDB concept row, or default.
+
+    Checks instead of catching: optional (try-block) columns come back as
+    None, and every key passed here is in the query's select. Query-level
+    failures are handled by the callers around each row loop.
+    """
+    concept = row.get(key)
+    if concept is None or not concept.is_attribute():
         return default
+    return concept.as_attribute().get_value()
 
 
 # ── Module-level singleton ────────────────────────────────────────────
@@ -490,3 +664,16 @@ def get_topic_router() -> TopicRouter:
     if _topic_router is None:
         _topic_router = TopicRouter()
     return _topic_router
+
+
+def on_ontology_changed() -> None:
+    """Drop routing caches after an in-process ontology write.
+
+    The TTL remains the backstop for writes made outside this process
+    (e.g. app/scripts loaders).
+    """
+    if _topic_router is not None:
+        _topic_router.invalidate_cache()
+    # The shared entity-type map reloads via the global client's pool
+    get_typedb_client().drain_read_pool()
+    TopicRouter.invalidate_entity_types_cache()
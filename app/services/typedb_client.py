@@ -2,6 +2,9 @@
 TypeDB Cloud Client for Valence - TypeDB 3.x API
 """
 import logging
+import queue
+import threading
+import time
 from typing import Optional, Any, Generator
 from contextlib import contextmanager
 
@@ -11,16 +14,41 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Idle read transactions kept for metadata loads, and how long one may be
+# reused (a read tx sees a fixed snapshot, so reuse bounds staleness)
+_READ_TX_POOL_SIZE = 4
+_READ_TX_MAX_AGE_SECONDS = 60
+
+# After a failed connect, health_check() reports the cached failure for
+# this long instead of reconnecting on every poll
+_HEALTH_RETRY_SECONDS = 5
+
 
 class TypeDBClient:
-    """TypeDB Cloud client wrapper."""
+    """TypeDB Cloud client wrapper.
+
+    Pass an existing driver to share one connection between clients (or to
+    inject a test double); a shared driver is never closed by this client.
+    """
     
-    def __init__(self):
+    def __init__(self, driver: Optional[Any] = None, database: Optional[str] = None):
         self.address = settings.normalized_typedb_address
-        self.database = settings.typedb_database
-        self.driver: Optional[Any] = None
-        self.is_connected = False
+        self.database = database or settings.typedb_database
+        self.driver: Optional[Any] = driver
+        self._owns_driver = driver is None
+        self.is_connected = driver is not None
         self.connection_error: Optional[str] = None
+        # Built on first connect() (inside its error handling: newer drivers
+        # can reject default options) and reused by every reconnect
+        self._driver_options: Optional[Any] = None
+        # (opened_at, tx) pairs for pooled_read_transaction()
+        self._read_tx_pool: "queue.LifoQueue" = queue.LifoQueue(maxsize=_READ_TX_POOL_SIZE)
+        # Bumped by drain_read_pool(); transactions checked out under an
+        # older epoch are closed on return instead of re-pooled
+        self._read_tx_epoch = 0
+        # Serializes (re)connects so concurrent first transactions open one driver
+        self._connect_lock = threading.Lock()
+        self._health_failed_at: Optional[float] = None
         
         logger.info(f"TypeDB client initialized for {self.address}/{self.database}")
     
@@ -29,12 +57,16 @@ class TypeDBClient:
         try:
             logger.info(f"Connecting to TypeDB at {self.address}...")
             
+            if self._driver_options is None:
+                self._driver_options = DriverOptions()
+            
             # TypeDB 3.x API: TypeDB.driver() not cloud_driver()
             self.driver = TypeDB.driver(
                 self.address,
                 Credentials(settings.typedb_username, settings.typedb_password),
-                DriverOptions()
+                self._driver_options
             )
+            self._owns_driver = True
             
             if not self.driver.databases.contains(self.database):
                 logger.info(f"Creating database: {self.database}")
@@ -55,18 +87,28 @@ class TypeDBClient:
             
             return False
     
+    def _ensure_connected(self) -> None:
+        """Connect once, even when many threads find the client disconnected."""
+        if self.is_connected:
+            return
+        with self._connect_lock:
+            # Re-check: another thread may have connected while we waited
+            if not self.is_connected:
+                self.connect(raise_on_error=True)
+
     def close(self):
         """Close TypeDB connection."""
+        self.drain_read_pool()
         if self.driver:
-            self.driver.close()
+            if self._owns_driver:
+                self.driver.close()
+                logger.info("TypeDB connection closed")
             self.is_connected = False
-            logger.info("TypeDB connection closed")
     
     @contextmanager
     def read_transaction(self) -> Generator:
         """Read transaction context manager."""
-        if not self.is_connected:
-            self.connect(raise_on_error=True)
+        self._ensure_connected()
         
         tx = self.driver.transaction(self.database, TransactionType.READ)
         try:
@@ -74,11 +116,66 @@ class TypeDBClient:
         finally:
             tx.close()
     
+    @contextmanager
+    def pooled_read_transaction(self) -> Generator:
+        """Read transaction reused across metadata loads.
+
+        Only for ontology/metadata reads: the snapshot can be up to
+        _READ_TX_MAX_AGE_SECONDS old. Deal data must use read_transaction().
+        """
+        self._ensure_connected()
+
+        epoch = self._read_tx_epoch
+        now = time.monotonic()
+        opened_at, tx = now, None
+        while tx is None:
+            try:
+                opened_at, pooled = self._read_tx_pool.get_nowait()
+            except queue.Empty:
+                opened_at = now
+                tx = self.driver.transaction(self.database, TransactionType.READ)
+                break
+            if now - opened_at < _READ_TX_MAX_AGE_SECONDS and pooled.is_open():
+                tx = pooled
+            elif pooled.is_open():
+                pooled.close()
+
+        try:
+            yield tx
+        except Exception:
+            # Don't hand a transaction that just failed to the next caller
+            if tx.is_open():
+                tx.close()
+            raise
+        else:
+            if epoch != self._read_tx_epoch:
+                # Pool was drained while in use: this snapshot may predate it
+                tx.close()
+                return
+            try:
+                self._read_tx_pool.put_nowait((opened_at, tx))
+            except queue.Full:
+                tx.close()
+
+    def drain_read_pool(self) -> None:
+        """Close all pooled read transactions.
+
+        Call after an ontology write so the next metadata load opens a fresh
+        snapshot instead of reusing one from before the write.
+        """
+        self._read_tx_epoch += 1
+        while True:
+            try:
+                _, tx = self._read_tx_pool.get_nowait()
+            except queue.Empty:
+                return
+            if tx.is_open():
+                tx.close()
+
     @contextmanager
     def write_transaction(self) -> Generator:
         """Write transaction context manager."""
-        if not self.is_connected:
-            self.connect(raise_on_error=True)
+        self._ensure_connected()
         
         tx = self.driver.transaction(self.database, TransactionType.WRITE)
         try:
@@ -93,8 +190,7 @@ class TypeDBClient:
     @contextmanager
     def schema_transaction(self) -> Generator:
         """Schema transaction context manager."""
-        if not self.is_connected:
-            self.connect(raise_on_error=True)
+        self._ensure_connected()
         
         tx = self.driver.transaction(self.database, TransactionType.SCHEMA)
         try:
@@ -109,8 +205,15 @@ class TypeDBClient:
     def health_check(self) -> dict:
         """Check TypeDB connection health."""
         if not self.is_connected:
-            success = self.connect()
+            failed_at = self._health_failed_at
+            recently_failed = (
+                failed_at is not None
+                and time.monotonic() - failed_at < _HEALTH_RETRY_SECONDS
+            )
+            success = False if recently_failed else self.connect()
             if not success:
+                if not recently_failed:
+                    self._health_failed_at = time.monotonic()
                 return {
                     "connected": False,
                     "error": self.connection_error,
@@ -1,58 +1,78 @@
 """SSoT-compliant category name resolution from TypeDB."""
 
-from typing import Dict
+from typing import Dict, Optional, Tuple
 import logging
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
-_category_name_cache: Dict[str, str] = {}
+# Category names only change on ontology reloads; the TTL is the backstop
+_CATEGORY_NAME_TTL = 300
+
+_category_name_cache: Optional[Tuple[float, Dict[str, str]]] = None  # (loaded_at, names)
+_category_name_lock = threading.Lock()
+
+_CATEGORY_NAMES_QUERY = """
+    match
+        $c isa ontology_category,
+            has category_id $cid,
+            has name $cname;
+    select $cid, $cname;
+"""
+
+
+def invalidate_category_cache() -> None:
+    """Force category names to reload on next access."""
+    global _category_name_cache
+    from app.services.typedb_client import typedb_client
+
+    # Drop pooled read snapshots so the reload sees the latest ontology
+    typedb_client.drain_read_pool()
+    _category_name_cache = None
 
 
 def get_category_names() -> Dict[str, str]:
     """
     Get category_id -> name mapping from TypeDB.
-    Cached after first successful call. Falls back to
-    'Category X' if TypeDB is unreachable.
+    Cached for _CATEGORY_NAME_TTL seconds; concurrent cold callers share
+    one load. Returns {} if TypeDB is unreachable.
     """
     global _category_name_cache
-    if _category_name_cache:
-        return _category_name_cache
+    cached = _category_name_cache
+    if cached is not None and (time.monotonic() - cached[0]) < _CATEGORY_NAME_TTL:
+        return cached[1]
 
-    try:
-        from app.services.typedb_client import typedb_client
-        from app.config import settings
-        from typedb.driver import TransactionType
+    with _category_name_lock:
+        # Re-check: another thread may have loaded while we waited
+        cached = _category_name_cache
+        if cached is not None and (time.monotonic() - cached[0]) < _CATEGORY_NAME_TTL:
+            return cached[1]
 
-        if not typedb_client.driver:
-            logger.warning("TypeDB not connected for category names")
-            return {}
-
-        tx = typedb_client.driver.transaction(
-            settings.typedb_database, TransactionType.READ
-        )
         try:
-            result = tx.query("""
-                match
-                    $c isa ontology_category,
-                        has category_id $cid,
-                        has name $cname;
-                select $cid, $cname;
-            """).resolve()
-
-            names = {}
-            for row in result.as_concept_rows():
-                cid = row.get("cid").as_attribute().get_value()
-                cname = row.get("cname").as_attribute().get_value()
-                names[cid] = cname
-
-            _category_name_cache = names
+            from app.services.typedb_client import typedb_client
+
+            if not typedb_client.driver:
+                logger.warning("TypeDB not connected for category names")
+                return {}
+
+            # Ontology metadata: a reused (pooled) read transaction is fine
+            with typedb_client.pooled_read_transaction() as tx:
+                result = tx.query(_CATEGORY_NAMES_QUERY).resolve()
+
+                # Both columns are required by the query, so unwrap directly
+                names = {
+                    row.get("cid").as_attribute().get_value():
+                        row.get("cname").as_attribute().get_value()
+                    for row in result.as_concept_rows()
+                }
+
+            _category_name_cache = (time.monotonic(), names)
             logger.info(f"Loaded {len(names)} category names from TypeDB")
             return names
-        finally:
-            tx.close()
-    except Exception as e:
-        logger.warning(f"Failed to load category names: {e}")
-        return {}
+        except Exception as e:
+            logger.warning(f"Failed to load category names: {e}")
+            return {}
 
 
 def resolve_category_name(category_id: str) -> str:
@@ -0,0 +1,67 @@
+"""Tests for TypeQL literal escaping and identifier validation in graph_storage."""
+import pytest
+
+from app.services.graph_storage import _safe_id, escape_typeql
+
+
+class TestEscapeTypeql:
+    """escape_typeql output must be safe inside a double-quoted TypeQL string."""
+
+    def test_empty_and_none(self):
+        assert escape_typeql("") == ""
+        assert escape_typeql(None) == ""
+
+    def test_clean_text_unchanged(self):
+        text = "Section 6.06(a) permits $50,000,000 of Restricted Payments"
+        assert escape_typeql(text) is text
+
+    def test_double_quote(self):
+        assert escape_typeql('the "Available Amount"') == 'the \\"Available Amount\\"'
+
+    def test_backslash(self):
+        assert escape_typeql("a\\b") == "a\\\\b"
+
+    def test_backslash_before_quote(self):
+        # Backslash is doubled first, so the quote can't be un-escaped
+        assert escape_typeql('\\"') == '\\\\\\"'
+
+    def test_newline(self):
+        assert escape_typeql("line one\nline two") == "line one\\nline two"
+
+    def test_carriage_return_dropped(self):
+        assert escape_typeql("line one\r\nline two") == "line one\\nline two"
+
+    def test_injection_attempt_stays_in_literal(self):
+        payload = 'x"; delete $p; match $p isa deal; "'
+        escaped = escape_typeql(payload)
+        # Every quote in the output is preceded by a backslash
+        assert '"' not in escaped.replace('\\"', "")
+
+
+class TestSafeId:
+    """_safe_id accepts plain identifiers only."""
+
+    @pytest.mark.parametrize("value", [
+        "rp_m1",
+        "deal-123_rp",
+        "basket_reallocation",
+        "ABC123",
+    ])
+    def test_accepts_identifiers(self, value):
+        assert _safe_id(value) == value
+
+    @pytest.mark.parametrize("value", [
+        "",
+        'rp"m1',
+        "rp\\m1",
+        "rp m1",
+        "rp_m1\n",
+        "rp_m1; delete $p;",
+        "deal.1",
+        "é",
+        None,
+        42,
+    ])
+    def test_rejects_unsafe(self, value):
+        with pytest.raises(ValueError):
+            _safe_id(value)
@@ -0,0 +1,29 @@
+"""Tests for the question-metadata TypeQL built in app.routers.deals."""
+import re
+
+from app.routers.deals import _question_meta_query
+
+
+def _squash(query: str) -> str:
+    return re.sub(r"\s+", " ", query).strip()
+
+
+class TestQuestionMetaQuery:
+    """One covenant type is matched by value; several use a disjunction."""
+
+    def test_single_type_matches_attribute_value(self):
+        q = _squash(_question_meta_query(["RP"]))
+        assert 'has covenant_type "RP",' in q
+        assert " or " not in q
+        assert "$ct" not in q
+        assert q.endswith("select $qid, $qtext, $cid, $cname;")
+
+    def test_multiple_types_use_disjunction(self):
+        q = _squash(_question_meta_query(["RP", "MFN"]))
+        assert "has covenant_type $ct," in q
+        assert '{ $ct == "RP"; } or { $ct == "MFN"; };' in q
+        assert q.endswith("select $ct, $qid, $qtext, $cid, $cname;")
+
+    def test_covenant_type_is_escaped(self):
+        q = _question_meta_query(['R"P'])
+        assert 'has covenant_type "R\\"P",' in q
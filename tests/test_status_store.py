@@ -0,0 +1,152 @@
+"""Tests for the bounded extraction status store."""
+import types
+
+import pytest
+
+from app.schemas.models import ExtractionStatus
+from app.services import status_store
+from app.services.status_store import ExtractionStatusStore
+
+
+def _status(deal_id: str, status: str = "extracting") -> ExtractionStatus:
+    return ExtractionStatus(deal_id=deal_id, status=status)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock for the store module."""
+    now = [1000.0]
+    monkeypatch.setattr(
+        status_store, "time", types.SimpleNamespace(monotonic=lambda: now[0])
+    )
+    return now
+
+
+class TestGetAndUpdate:
+    """Dict-style get/update semantics."""
+
+    def test_missing_deal(self):
+        store = ExtractionStatusStore()
+        assert store.get("d1") is None
+        assert "d1" not in store
+        with pytest.raises(KeyError):
+            store["d1"]
+
+    def test_set_then_get(self):
+        store = ExtractionStatusStore()
+        s = _status("d1")
+        store["d1"] = s
+        assert store.get("d1") is s
+        assert store["d1"] is s
+        assert "d1" in store
+
+    def test_update_replaces_status(self):
+        store = ExtractionStatusStore()
+        store["d1"] = _status("d1", "extracting")
+        store["d1"] = _status("d1", "complete")
+        assert store["d1"].status == "complete"
+
+    def test_delete(self):
+        store = ExtractionStatusStore()
+        store["d1"] = _status("d1")
+        del store["d1"]
+        assert "d1" not in store
+        with pytest.raises(KeyError):
+            del store["d1"]
+
+    def test_pop(self):
+        store = ExtractionStatusStore()
+        s = _status("d1")
+        store["d1"] = s
+        assert store.pop("d1") is s
+        assert "d1" not in store
+        assert store.pop("d1") is None
+        assert store.pop("d1", "missing") == "missing"
+
+    def test_pop_expired_returns_default(self, clock):
+        store = ExtractionStatusStore(ttl_seconds=10)
+        store["d1"] = _status("d1", "complete")
+        clock[0] += 11
+        assert store.pop("d1") is None
+        assert "d1" not in store._entries
+
+
+class TestCapacity:
+    """max_finished caps finished entries only, oldest update first."""
+
+    def test_oldest_finished_evicted_first(self, clock):
+        store = ExtractionStatusStore(max_finished=2)
+        for deal_id in ("d1", "d2", "d3"):
+            clock[0] += 1
+            store[deal_id] = _status(deal_id, "complete")
+        assert "d1" not in store
+        assert "d2" in store
+        assert "d3" in store
+
+    def test_update_refreshes_eviction_order(self, clock):
+        store = ExtractionStatusStore(max_finished=2)
+        store["d1"] = _status("d1", "complete")
+        clock[0] += 1
+        store["d2"] = _status("d2", "error")
+        clock[0] += 1
+        # Re-writing d1 makes d2 the oldest finished entry
+        store["d1"] = _status("d1", "complete")
+        clock[0] += 1
+        store["d3"] = _status("d3", "complete")
+        assert "d2" not in store
+        assert "d1" in store
+        assert "d3" in store
+
+    def test_in_flight_never_evicted(self, clock):
+        store = ExtractionStatusStore(max_finished=1)
+        store["running"] = _status("running", "extracting")
+        for deal_id in ("d1", "d2", "d3"):
+            clock[0] += 1
+            store[deal_id] = _status(deal_id, "complete")
+        assert store["running"].status == "extracting"
+        assert "d3" in store
+        assert "d1" not in store
+        assert "d2" not in store
+
+    def test_in_flight_does_not_count_toward_cap(self):
+        store = ExtractionStatusStore(max_finished=1)
+        store["a"] = _status("a", "pending")
+        store["b"] = _status("b", "storing")
+        store["c"] = _status("c", "complete")
+        assert all(d in store for d in ("a", "b", "c"))
+
+
+class TestTTL:
+    """Finished entries expire after ttl_seconds; in-flight entries do not."""
+
+    def test_finished_expires_on_get(self, clock):
+        store = ExtractionStatusStore(ttl_seconds=10)
+        store["d1"] = _status("d1", "complete")
+        clock[0] += 10
+        assert "d1" in store
+        clock[0] += 1
+        assert store.get("d1") is None
+        with pytest.raises(KeyError):
+            store["d1"]
+
+    def test_in_flight_does_not_expire(self, clock):
+        store = ExtractionStatusStore(ttl_seconds=10)
+        store["d1"] = _status("d1", "extracting")
+        clock[0] += 1000
+        assert store["d1"].status == "extracting"
+
+    def test_update_resets_ttl(self, clock):
+        store = ExtractionStatusStore(ttl_seconds=10)
+        store["d1"] = _status("d1", "complete")
+        clock[0] += 8
+        store["d1"] = _status("d1", "complete")
+        clock[0] += 8
+        assert "d1" in store
+
+    def test_expired_pruned_on_write(self, clock):
+        store = ExtractionStatusStore(ttl_seconds=10)
+        store["old"] = _status("old", "error")
+        clock[0] += 11
+        store["new"] = _status("new", "complete")
+        assert "old" not in store._entries
+        assert "new" in store
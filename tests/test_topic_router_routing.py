@@ -0,0 +1,244 @@
+"""Unit tests for TopicRouter scoring, result shape and route memoization.
+
+Metadata comes from an in-memory fixture instead of TypeDB; the scoring is
+checked against a straightforward per-category reference implementation so
+the keyword-index fast path can't drift from it.
+"""
+import dataclasses
+from typing import Dict, List
+
+import pytest
+
+from app.services.topic_router import (
+    CategoryMetadata,
+    TopicRouter,
+    TopicRouteResult,
+    _tokenize,
+    _tokenize_lower,
+)
+
+
+class _FakeClient:
+    """Stands in for TypeDBClient; records read-pool drains."""
+
+    def __init__(self):
+        self.drains = 0
+
+    def drain_read_pool(self):
+        self.drains += 1
+
+
+# (category_id, name, description, covenant_type, question_ids, target_fields)
+_CATEGORY_ROWS = [
+    ("A", "Builder Basket", "Cumulative credit from retained excess cash flow",
+     "RP", ["rp_a1", "rp_a2"], ["builder_start_date", "retained_ecf_pct"]),
+    ("B", "Ratio Basket", "Unlimited payments subject to a leverage ratio test",
+     "RP", ["rp_b1", "rp_shared"], ["ratio_threshold"]),
+    ("C", "J.Crew Blocker", "Restrictions on transferring material intellectual property",
+     "RP", ["rp_c1", "rp_shared"], ["covers_ip_transfer", "ratio_threshold"]),
+    ("D", "MFN Protection", "Most favored nation yield protection for incremental loans",
+     "MFN", ["mfn_d1"], ["mfn_margin_bps"]),
+    ("E", "Ratio Debt", "Debt incurrence permitted subject to a leverage ratio",
+     "DI", ["di_e1"], ["di_ratio_level"]),
+]
+
+
+def _build_categories() -> Dict[str, CategoryMetadata]:
+    """Categories as _load_category_metadata would return them (frozen fields)."""
+    categories = {}
+    for cid, name, desc, cov, qids, fields in _CATEGORY_ROWS:
+        keywords = _tokenize(name) | _tokenize(desc)
+        for f in fields:
+            keywords |= _tokenize(f.replace("_", " "))
+        categories[cid] = CategoryMetadata(
+            category_id=cid,
+            name=name,
+            description=desc,
+            covenant_type=cov,
+            question_ids=tuple(qids),
+            target_fields=tuple(fields),
+            name_lower=name.lower(),
+            keywords=frozenset(keywords),
+        )
+    return categories
+
+
+def _reference_route(categories: Dict[str, CategoryMetadata], question: str) -> List[str]:
+    """Per-category scoring without the keyword index.
+
+    2 per keyword equal to a question token, 1 per other keyword found as a
+    substring, 10 if the category name appears; keep scores >= 25% of the top.
+    """
+    q_lower = question.lower().strip()
+    tokens = _tokenize_lower(q_lower)
+    scored = []
+    for cat in categories.values():
+        score = 2 * len(tokens & cat.keywords)
+        score += sum(1 for kw in cat.keywords - tokens if kw in q_lower)
+        if cat.name_lower in q_lower:
+            score += 10
+        if score > 0:
+            scored.append((score, cat))
+    scored.sort(key=lambda s: s[0], reverse=True)
+    if not scored:
+        return []
+    threshold = max(1, scored[0][0] * 0.25)
+    return [cat.category_id for score, cat in scored if score >= threshold]
+
+
+@pytest.fixture
+def client():
+    return _FakeClient()
+
+
+@pytest.fixture
+def router(client, monkeypatch):
+    r = TopicRouter(client=client)
+    loads = []
+
+    def load():
+        loads.append(1)
+        return _build_categories()
+
+    monkeypatch.setattr(r, "_load_category_metadata", load)
+    r.loads = loads
+    return r
+
+
+_QUESTIONS = [
+    "What is the builder basket?",
+    "How much capacity is in the baskets?",
+    "Is there a J.Crew blocker on intellectual property?",
+    "What leverage ratio applies to the ratio basket and ratio debt?",
+    "Does the MFN protection cover incremental loans?",
+    "Tell me about retained excess cash flow and the builder start date",
+    "ratio",
+    "builder basket tests",
+    "What's the weather like?",
+    "",
+    "   RATIO BASKET   ",
+]
+
+
+class TestRoutingEquivalence:
+    """route() matches the reference scoring, in the same order."""
+
+    @pytest.mark.parametrize("question", _QUESTIONS)
+    def test_matches_reference(self, router, question):
+        result = router.route(question)
+        expected = _reference_route(_build_categories(), question)
+        assert [c.category_id for c in result.matched_categories] == expected
+
+    def test_token_match_not_double_counted(self, router):
+        # A: name 10 + two tokens = 14, threshold 3.5. B: "basket" token 2 +
+        # "test" inside "tests" 1 = 3, so it drops out. Scoring whole-token
+        # keywords again as substrings would lift B to 4 against 16 / 4.
+        result = router.route("builder basket tests")
+        assert [c.category_id for c in result.matched_categories] == ["A"]
+
+    def test_partial_keyword_match(self, router):
+        # "basket" only appears inside "baskets": substring credit, no overlap
+        result = router.route("baskets")
+        assert {c.category_id for c in result.matched_categories} == {"A", "B"}
+
+    @pytest.mark.parametrize("question, covenant_type", [
+        ("What is the builder basket?", "rp"),
+        ("Does the MFN protection cover incremental loans?", "mfn"),
+        ("Ratio Debt", "di"),
+        ("ratio", "both"),
+        ("What's the weather like?", "both"),
+    ])
+    def test_covenant_type(self, router, question, covenant_type):
+        assert router.route(question).covenant_type == covenant_type
+
+
+class TestRouteResult:
+    """Shape of the (shared, immutable) TopicRouteResult."""
+
+    def test_fields_are_tuples(self, router):
+        result = router.route("ratio")
+        assert isinstance(result, TopicRouteResult)
+        assert isinstance(result.matched_categories, tuple)
+        assert isinstance(result.question_ids, tuple)
+        assert isinstance(result.all_target_fields, tuple)
+
+    def test_aggregates_dedup_in_order(self, router):
+        result = router.route("ratio")
+        assert result.question_ids == ("rp_b1", "rp_shared", "rp_c1", "di_e1")
+        assert result.all_target_fields == (
+            "ratio_threshold", "covers_ip_transfer", "di_ratio_level",
+        )
+
+    def test_is_specific(self, router):
+        assert router.route("ratio").is_specific is True
+        assert router.route("What's the weather like?").is_specific is False
+
+    def test_no_match(self, router):
+        result = router.route("What's the weather like?")
+        assert result.matched_categories == ()
+        assert result.question_ids == ()
+        assert result.all_target_fields == ()
+        assert result.covenant_type == "both"
+
+    def test_frozen(self, router):
+        result = router.route("ratio")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.covenant_type = "rp"
+
+    def test_field_names_returns_copy(self, router):
+        names = router.get_relevant_field_names("ratio")
+        names.append("extra")
+        assert "extra" not in router.route("ratio").all_target_fields
+
+
+class TestRouteMemo:
+    """Memoization per normalized question, cleared by invalidate_cache."""
+
+    def test_same_question_returns_memoized_result(self, router):
+        first = router.route("Ratio Basket")
+        assert router.route("  ratio basket ") is first
+        assert len(router.loads) == 1
+
+    def test_invalidate_cache_clears_memo(self, router, client):
+        first = router.route("Ratio Basket")
+        router.invalidate_cache()
+        assert len(router._route_cache) == 0
+        assert router._cache is None
+        assert client.drains == 1
+
+        second = router.route("Ratio Basket")
+        assert second is not first
+        assert second == first
+        assert len(router.loads) == 2
+
+
+class TestRefreshGeneration:
+    """A reload overlapping invalidate_cache() never installs its result."""
+
+    def test_refresh_discarded_after_invalidation(self, router, monkeypatch):
+        router.route("ratio")
+
+        def load_then_invalidate():
+            # Ontology changed while this (now stale) load was in flight
+            router.invalidate_cache()
+            return _build_categories()
+
+        monkeypatch.setattr(router, "_load_category_metadata", load_then_invalidate)
+        router._refresh()
+        assert router._cache is None
+        assert router._keyword_index == {}
+
+    def test_first_load_retries_after_invalidation(self, router, monkeypatch):
+        loads = []
+
+        def load():
+            loads.append(1)
+            if len(loads) == 1:
+                router.invalidate_cache()
+            return _build_categories()
+
+        monkeypatch.setattr(router, "_load_category_metadata", load)
+        result = router.route("ratio")
+        assert len(loads) == 2
+        assert router._cache is not None
+        assert [c.category_id for c in result.matched_categories] == ["B", "C", "E"]